@@ -0,0 +1,72 @@
+"""Cold-start budget check for the headless entry points.
+
+Run from the repository root::
+
+    python benchmarks/startup.py
+
+Every case is timed in fresh interpreters. The script exits non-zero if a
+case's median wall time goes over its budget, or if the case imports a
+module it must not need (checked with ``python -X importtime``).
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+GUI_MODULES = ('streamlit', 'plotly', 'pandas')
+
+# (name, interpreter arguments, budget in seconds, modules that must not be imported)
+CASES = [
+    ('interpreter', ['-c', 'pass'], 0.10, ()),
+    ('engine', ['-c', 'from seedling_model import Params, simulate; simulate(Params())'],
+     0.15, GUI_MODULES + ('numpy',)),
+    ('batch engine', ['-c', 'from seedling_model import Params, simulate_batch; simulate_batch(Params())'],
+     0.50, GUI_MODULES),
+    ('executor worker', ['-c', 'import seedling_model.executor'], 0.60, GUI_MODULES),
+    ('cli', ['-m', 'seedling_simulator', 'run', '--help'], 1.00, GUI_MODULES),
+]
+
+
+def time_case(args, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def imported_modules(args):
+    completed = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=ROOT, check=True,
+                               capture_output=True, text=True)
+    # Lines look like "import time:   self [us] | cumulative | module"
+    return {
+        line.rsplit('|', 1)[1].strip().split('.')[0]
+        for line in completed.stderr.splitlines()
+        if line.startswith('import time:') and '|' in line
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7, help="runs per case (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for name, case_args, budget, forbidden in CASES:
+        elapsed = time_case(case_args, args.repeat)
+        leaked = sorted(set(forbidden) & imported_modules(case_args))
+        ok = elapsed <= budget and not leaked
+        failures += not ok
+        note = f"  imports {', '.join(leaked)}" if leaked else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {name:<16} {elapsed * 1000:7.1f} ms  (budget {budget * 1000:.0f} ms){note}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
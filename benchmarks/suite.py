@@ -0,0 +1,399 @@
+"""Benchmark suite for the engine, the charts and the Streamlit rerun path.
+
+Run from the repository root::
+
+    python benchmarks/suite.py                 # compare against baseline.json
+    python benchmarks/suite.py --save          # record a new baseline
+    python benchmarks/suite.py -k batch        # only cases whose name contains "batch"
+
+Each case is timed with ``timeit`` (auto-ranged loop count, best of
+``--repeat`` rounds), and the peak memory allocated by a single call is
+reported from ``tracemalloc``. A case regresses when it is more than ``--tolerance``
+slower than its stored baseline; any regression makes the script exit
+non-zero. Baselines are machine specific, so re-record them with ``--save``
+when the benchmark host changes.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from seedling_model import (  # noqa: E402
+    Params,
+    RiskModel,
+    iter_cycles,
+    monte_carlo,
+    payback_years,
+    simulate,
+    simulate_batch,
+    simulate_cycles,
+)
+
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+APP_PATH = ROOT / 'seedling_simulator.py'
+BATCH_SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+
+CASES = {}
+
+
+def case(name, rows=None):
+    """Register a case. The decorated function does its setup and returns the callable to time."""
+    def register(setup):
+        CASES[name] = (setup, rows)
+        return setup
+    return register
+
+
+def random_params(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return Params(
+        labor_cost_per_month=rng.uniform(200, 2000, rows),
+        num_trays=rng.uniform(5000, 20000, rows),
+        success_rate=rng.uniform(0.5, 1.0, rows),
+        avg_price_veg=rng.uniform(0.01, 0.20, rows),
+        veg_percentage=rng.uniform(0.0, 1.0, rows),
+    )
+
+
+# --- ENGINE ---
+
+@case('engine.simulate')
+def bench_simulate():
+    params = Params()
+    return lambda: simulate(params)
+
+
+for _rows in BATCH_SIZES:
+    @case(f'engine.simulate_batch[{_rows:.0e}]', rows=_rows)
+    def bench_simulate_batch(rows=_rows):
+        params = random_params(rows)
+        return lambda: simulate_batch(params)
+
+
+@case('engine.monte_carlo[1e5]', rows=100_000)
+def bench_monte_carlo():
+    params, risk_model = Params(), RiskModel()
+    return lambda: monte_carlo(params, risk_model, trials=100_000, seed=1)
+
+
+@case('cache.cached_monte_carlo[1e5, disk hit]', rows=100_000)
+def bench_cached_monte_carlo():
+    from seedling_model.cache import ResultCache, cached_monte_carlo
+    # In the suite's temporary SEEDLING_CACHE_DIR, which main removes afterwards
+    cache = ResultCache()
+    params, risk_model = Params(), RiskModel()
+    cached_monte_carlo(params, risk_model, trials=100_000, seed=1, cache=cache)
+    return lambda: cached_monte_carlo(params, risk_model, trials=100_000, seed=1, cache=cache)
+
+
+@case('engine.simulate_cycles[30y x 1e4]', rows=10_000)
+def bench_simulate_cycles():
+    # 3.5-month cycles put the end of depreciation part-way through a cycle
+    check = simulate_cycles(Params(cycle_months=3.5), years=15)
+    if not np.isclose(check.depreciation.sum(), simulate(Params()).capex):
+        raise RuntimeError(f"simulate_cycles depreciated {check.depreciation.sum():,.2f}, "
+                           f"not the CAPEX of {simulate(Params()).capex:,.2f}")
+    params = random_params(10_000)
+    return lambda: simulate_cycles(params, years=30, price_inflation=0.05)
+
+
+def random_catalogue(products, seed=0):
+    from seedling_model.catalogue import Product, stack_products
+    rng = np.random.default_rng(seed)
+    return stack_products([
+        Product(f'product {i}', 'Vegetable', 200, rng.uniform(0.6, 0.95), rng.uniform(1, 9),
+                rng.uniform(0.02, 1.0), rng.uniform(1e4, 1e6))
+        for i in range(products)
+    ])
+
+
+@case('engine.simulate_catalogue[300 products x 5e3]', rows=5_000)
+def bench_simulate_catalogue():
+    from seedling_model.catalogue import simulate_catalogue
+    catalogue = random_catalogue(300)
+    trays = np.random.default_rng(1).uniform(0, 100, (5_000, 300))
+    return lambda: simulate_catalogue(catalogue, trays)
+
+
+@case('optimize.optimize_mix[300 products, LP]')
+def bench_optimize_mix_lp():
+    from seedling_model.optimize import optimize_mix
+    catalogue = random_catalogue(300)
+    return lambda: optimize_mix(catalogue, 10_000, 0.225, 0.08, labor_budget=9_000, medium_budget=3_200)
+
+
+@case('optimize.optimize_mix[default catalogue, MILP]')
+def bench_optimize_mix_milp():
+    from seedling_model.catalogue import DEFAULT_CATALOGUE
+    from seedling_model.optimize import optimize_mix
+    return lambda: optimize_mix(DEFAULT_CATALOGUE, 2_000, 0.225, 0.08, labor_budget=9_000, medium_budget=3_200,
+                                integer=True)
+
+
+@case('scenarios.compare[50 scenarios, cold]', rows=50)
+def bench_compare_scenarios():
+    from seedling_model.batch import as_batch
+    from seedling_model.scenarios import ScenarioStore
+    param_sets = [Params._make(row) for row in np.column_stack(as_batch(random_params(50)))]
+
+    def run():
+        store = ScenarioStore()
+        for i, params in enumerate(param_sets):
+            store.put(f'scenario {i}', params)
+        return store.compare(years=10)
+    return run
+
+
+@case('engine.iter_cycles[30y x 1e4]', rows=10_000)
+def bench_iter_cycles():
+    params = random_params(10_000)
+
+    def run():
+        for _ in iter_cycles(params, years=30, price_inflation=0.05):
+            pass
+    return run
+
+
+@case('engine.payback_years[1e4]', rows=10_000)
+def bench_payback_years():
+    params = random_params(10_000)
+    return lambda: payback_years(params)
+
+
+@case('cohorts.simulate_cohorts[5e3 cohorts, 1y]', rows=5_000)
+def bench_simulate_cohorts():
+    from seedling_model.cohorts import simulate_cohorts
+    rng = np.random.default_rng(0)
+    sow_week = rng.integers(-10, 52, 5_000)
+    seeds = rng.uniform(100, 5_000, 5_000)
+    stage_weeks = rng.integers(1, 6, (5_000, 3))
+    return lambda: simulate_cohorts(sow_week, seeds, stage_weeks=stage_weeks)
+
+
+@case('benches.simulate_benches[50 daily streams x 5y]')
+def bench_simulate_benches():
+    from seedling_model.benches import Nursery, Sowing, simulate_benches
+    nursery = Nursery(bench_trays=5_000, tray_stock=5_500)
+    sowings = [Sowing(20, every_days=1, first_day=i / 50, grow_days=30 + i % 20) for i in range(50)]
+    return lambda: simulate_benches(nursery, sowings, days=5 * 365, seed=0)
+
+
+# --- CHARTS ---
+
+@case('charts.profit_figure')
+def bench_profit_figure():
+    from seedling_model.charts import profit_figure
+    series = simulate_cycles(Params(), years=5)
+    return lambda: profit_figure(series.year, series.cumulative_profit, 7500, 5)
+
+
+@case('charts.revenue_mix_figure')
+def bench_revenue_mix_figure():
+    from seedling_model.charts import revenue_mix_figure
+    return lambda: revenue_mix_figure(95200.0, 40800.0)
+
+
+@case('charts.patch_profit_figure')
+def bench_patch_profit_figure():
+    from seedling_model.charts import patch_profit_figure, profit_template
+    series = simulate_cycles(Params(), years=5)
+    fig = profit_template()
+    return lambda: patch_profit_figure(fig, series.year, series.cumulative_profit, 7500, 5)
+
+
+@case('charts.patch_revenue_mix_figure')
+def bench_patch_revenue_mix_figure():
+    from seedling_model.charts import patch_revenue_mix_figure, revenue_mix_template
+    fig = revenue_mix_template()
+    return lambda: patch_revenue_mix_figure(fig, 95200.0, 40800.0)
+
+
+# --- STREAMLIT RERUN ---
+
+def _app_test():
+    """AppTest of the app that compiles the script once, as a running server does.
+
+    AppTest hands every run a new ``ScriptCache``, so each rerun (fragment
+    reruns included) would parse and compile the whole script again and the
+    app cases would time the length of the file rather than the rerun.
+    """
+    import streamlit as st
+    from streamlit.logger import set_log_level
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import AppTest, local_script_runner
+
+    script_cache = getattr(local_script_runner.ScriptCache, 'shared', None)
+    if script_cache is None:
+        if local_script_runner.ScriptCache is not ScriptCache:
+            raise RuntimeError(f"the app cases rely on AppTest internals that Streamlit {st.__version__} "
+                               f"doesn't have; update _app_test for this version")
+        script_cache = ScriptCache()
+        local_script_runner.ScriptCache = lambda: script_cache
+        local_script_runner.ScriptCache.shared = script_cache
+    set_log_level('error')
+    return AppTest.from_file(str(APP_PATH), default_timeout=60)
+
+
+@case('app.rerun[warm cache]')
+def bench_app_rerun_warm():
+    at = _app_test()
+    at.run()
+    return at.run
+
+
+@case('app.rerun[cold cache]')
+def bench_app_rerun_cold():
+    import streamlit as st
+
+    from seedling_model.cache import ResultCache
+    at = _app_test()
+    at.run()
+
+    def rerun():
+        # The app's result cache lives in the suite's temporary SEEDLING_CACHE_DIR
+        st.cache_data.clear()
+        ResultCache().clear()
+        at.run()
+    return rerun
+
+
+def _fragment_rerun_internals(at):
+    """The private Streamlit pieces the fragment case patches, checked up front.
+
+    AppTest has no public way to rerun a single fragment, so the case relies
+    on internals that can change in any Streamlit release; fail loudly rather
+    than silently timing a full-script rerun.
+    """
+    import dataclasses
+
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import RerunData
+    from streamlit.testing.v1 import local_script_runner
+
+    fragments = getattr(getattr(at, '_fragment_storage', None), '_fragments', None)
+    if (not isinstance(fragments, dict) or not fragments
+            or getattr(local_script_runner, 'RerunData', None) is not RerunData
+            or 'fragment_id_queue' not in {field.name for field in dataclasses.fields(RerunData)}):
+        raise RuntimeError(f"app.rerun[risk slider, fragment] relies on AppTest internals that "
+                           f"Streamlit {st.__version__} doesn't have; update the case for this version")
+    return fragments, RerunData, local_script_runner
+
+
+def _risk_slider_rerun(fragment_only):
+    """Move the drought slider back and forth between two (cached) values and rerun."""
+    at = _app_test()
+    at.run()
+    values = [20, 30]
+
+    def run():
+        import functools
+        from unittest import mock
+
+        values.reverse()
+        at.slider(key='drought_probability').set_value(values[0])
+        if not fragment_only:
+            return at.run()
+        # AppTest always reruns the whole script; queue the risk fragment the
+        # way the browser does when a widget inside it changes.
+        fragments, rerun_data, local_script_runner = _fragment_rerun_internals(at)
+        rerun_data = functools.partial(rerun_data, fragment_id_queue=list(fragments))
+        with mock.patch.object(local_script_runner, 'RerunData', rerun_data):
+            return at.run()
+    run()
+    run()
+    return run
+
+
+@case('app.rerun[risk slider, full script]')
+def bench_app_risk_full():
+    return _risk_slider_rerun(fragment_only=False)
+
+
+@case('app.rerun[risk slider, fragment]')
+def bench_app_risk_fragment():
+    return _risk_slider_rerun(fragment_only=True)
+
+
+def measure(setup, repeat):
+    """Return (seconds per call, peak bytes allocated by one call)."""
+    run = setup()
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat, number)) / number
+
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def load_baseline():
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text()).get('results', {})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', dest='pattern', default='', help="only run cases whose name contains this")
+    parser.add_argument('--repeat', type=int, default=5, help="timing rounds per case (default: %(default)s)")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown against the baseline (default: %(default)s)")
+    parser.add_argument('--max-rows', type=float, default=1e7, help="skip batch sizes above this")
+    parser.add_argument('--save', action='store_true', help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    # Keeps the app's on-disk result cache out of the user's real cache
+    # directory, and lets the cold case start from an empty one
+    with tempfile.TemporaryDirectory(prefix='seedling-bench-') as cache_dir:
+        os.environ['SEEDLING_CACHE_DIR'] = cache_dir
+        return run_cases(args)
+
+
+def run_cases(args):
+    baseline = load_baseline()
+    results = {}
+    regressions = 0
+    for name, (setup, rows) in CASES.items():
+        if args.pattern not in name or (rows or 0) > args.max_rows:
+            continue
+        seconds, peak = measure(setup, args.repeat)
+        results[name] = seconds
+
+        line = f"{name:<36} {seconds * 1000:10.3f} ms  {peak / 1024:10,.0f} KB peak"
+        if rows:
+            line += f"  {rows / seconds:14,.0f} rows/s"
+        if name in baseline:
+            change = seconds / baseline[name] - 1
+            regressed = change > args.tolerance
+            regressions += regressed
+            line += f"  {change:+7.1%} vs baseline{'  REGRESSION' if regressed else ''}"
+        print(line, flush=True)
+
+    if args.save:
+        merged = {**baseline, **results}
+        BASELINE_PATH.write_text(json.dumps({
+            'machine': f"{platform.machine()} {platform.processor() or platform.system()}, Python {platform.python_version()}",
+            'results': dict(sorted(merged.items())),
+        }, indent=2) + '\n')
+        print(f"baseline written to {BASELINE_PATH.relative_to(ROOT)}")
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
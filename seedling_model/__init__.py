@@ -0,0 +1,160 @@
+"""Headless seedling nursery model used by the Streamlit dashboard.
+
+Only the pure-Python engine is imported eagerly. Everything else needs
+NumPy (or more) and is imported the first time one of its names is used,
+so ``from seedling_model import simulate`` stays cheap for CLI and worker
+start-up.
+"""
+
+import importlib
+
+from seedling_model.engine import (
+    CELLS_PER_TRAY,
+    CYCLES_PER_YEAR,
+    ENGINE_VERSION,
+    LABOR_MONTHS_PER_CYCLE,
+    MONTHS_PER_YEAR,
+    PARAM_LIMITS,
+    PARAM_RANGES,
+    RISK_SCENARIOS,
+    TRAY_FORMATS,
+    Params,
+    Results,
+    cycles_per_year,
+    simulate,
+)
+
+_LAZY_ATTRIBUTES = {
+    'as_batch': 'seedling_model.batch',
+    'check_params': 'seedling_model.batch',
+    'roi': 'seedling_model.batch',
+    'simulate_batch': 'seedling_model.batch',
+    'stack_params': 'seedling_model.batch',
+    'BenchResults': 'seedling_model.benches',
+    'Nursery': 'seedling_model.benches',
+    'Sowing': 'seedling_model.benches',
+    'simulate_benches': 'seedling_model.benches',
+    'ResultCache': 'seedling_model.cache',
+    'cached_monte_carlo': 'seedling_model.cache',
+    'cached_sweep': 'seedling_model.cache',
+    'DEFAULT_CATALOGUE': 'seedling_model.catalogue',
+    'DEFAULT_PRODUCTS': 'seedling_model.catalogue',
+    'Catalogue': 'seedling_model.catalogue',
+    'CatalogueResults': 'seedling_model.catalogue',
+    'Product': 'seedling_model.catalogue',
+    'category_totals': 'seedling_model.catalogue',
+    'simulate_catalogue': 'seedling_model.catalogue',
+    'stack_products': 'seedling_model.catalogue',
+    'DEFAULT_STAGES': 'seedling_model.cohorts',
+    'CohortResults': 'seedling_model.cohorts',
+    'Stage': 'seedling_model.cohorts',
+    'simulate_cohorts': 'seedling_model.cohorts',
+    'survival': 'seedling_model.cohorts',
+    'weekly_sowings': 'seedling_model.cohorts',
+    'monte_carlo_parallel': 'seedling_model.executor',
+    'simulate_parallel': 'seedling_model.executor',
+    'TrayMix': 'seedling_model.optimize',
+    'optimize_mix': 'seedling_model.optimize',
+    'RiskModel': 'seedling_model.risk',
+    'RiskSummary': 'seedling_model.risk',
+    'monte_carlo': 'seedling_model.risk',
+    'sample_adjusted_profit': 'seedling_model.risk',
+    'Comparison': 'seedling_model.scenarios',
+    'ScenarioStore': 'seedling_model.scenarios',
+    'Sweep': 'seedling_model.sensitivity',
+    'Tornado': 'seedling_model.sensitivity',
+    'sweep': 'seedling_model.sensitivity',
+    'tornado': 'seedling_model.sensitivity',
+    'min_avg_price_veg': 'seedling_model.solver',
+    'min_num_trays': 'seedling_model.solver',
+    'min_success_rate': 'seedling_model.solver',
+    'solve_for': 'seedling_model.solver',
+    'FLAT_SEASONALITY': 'seedling_model.timeseries',
+    'MAX_YEARS': 'seedling_model.timeseries',
+    'CycleSeries': 'seedling_model.timeseries',
+    'CycleStep': 'seedling_model.timeseries',
+    'iter_cycles': 'seedling_model.timeseries',
+    'payback_years': 'seedling_model.timeseries',
+    'simulate_cycles': 'seedling_model.timeseries',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+__all__ = [
+    'CELLS_PER_TRAY',
+    'CYCLES_PER_YEAR',
+    'DEFAULT_CATALOGUE',
+    'DEFAULT_PRODUCTS',
+    'DEFAULT_STAGES',
+    'ENGINE_VERSION',
+    'FLAT_SEASONALITY',
+    'LABOR_MONTHS_PER_CYCLE',
+    'MAX_YEARS',
+    'MONTHS_PER_YEAR',
+    'PARAM_LIMITS',
+    'PARAM_RANGES',
+    'RISK_SCENARIOS',
+    'TRAY_FORMATS',
+    'BenchResults',
+    'Catalogue',
+    'CatalogueResults',
+    'CohortResults',
+    'Comparison',
+    'CycleSeries',
+    'CycleStep',
+    'Nursery',
+    'Params',
+    'Product',
+    'ResultCache',
+    'Results',
+    'RiskModel',
+    'RiskSummary',
+    'ScenarioStore',
+    'Sowing',
+    'Stage',
+    'Sweep',
+    'Tornado',
+    'TrayMix',
+    'as_batch',
+    'cached_monte_carlo',
+    'cached_sweep',
+    'category_totals',
+    'check_params',
+    'cycles_per_year',
+    'iter_cycles',
+    'min_avg_price_veg',
+    'min_num_trays',
+    'min_success_rate',
+    'monte_carlo',
+    'monte_carlo_parallel',
+    'optimize_mix',
+    'payback_years',
+    'roi',
+    'sample_adjusted_profit',
+    'simulate',
+    'simulate_batch',
+    'simulate_benches',
+    'simulate_catalogue',
+    'simulate_cohorts',
+    'simulate_cycles',
+    'simulate_parallel',
+    'solve_for',
+    'stack_params',
+    'stack_products',
+    'survival',
+    'sweep',
+    'tornado',
+    'weekly_sowings',
+]
@@ -0,0 +1,5 @@
+import sys
+
+from seedling_model.cli import main
+
+sys.exit(main())
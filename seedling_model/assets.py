@@ -0,0 +1,113 @@
+"""Local images for the dashboard, resized and compressed for display.
+
+Images are read from the repository's ``assets/`` directory, scaled down to
+the width they are shown at and re-encoded as WebP (JPEG if this Pillow
+build has no WebP support). If a file is missing or unreadable a generated
+placeholder is returned instead, so the page never depends on the network.
+Pillow is imported on first use.
+
+Add a photo with ``python -m seedling_model.assets NAME SOURCE``, which
+stores it under the expected file name, already scaled to its display width.
+"""
+
+import argparse
+import io
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / 'assets'
+QUALITY = 80
+
+
+class Asset(NamedTuple):
+    filename: str
+    width: int
+    caption: str
+    placeholder_color: str
+
+
+# Widths are the largest the images are displayed at in the wide layout.
+IMAGES = {
+    'vision': Asset('nursery_vision.jpg', 1200,
+                    "A vision for our commercial nursery in rural Zimbabwe.", '#6b8e23'),
+    'vegetable_seedlings': Asset('vegetable_seedlings.jpg', 600,
+                                 "High-quality vegetable seedlings ready for local farmers.", '#2ca02c'),
+    'tree_seedlings': Asset('tree_seedlings.jpg', 600,
+                            "Tree seedlings to support afforestation and community orchards.", '#8c564b'),
+}
+
+
+def _encode(image):
+    from PIL import features
+
+    buffer = io.BytesIO()
+    if features.check('webp'):
+        image.save(buffer, format='WEBP', quality=QUALITY, method=4)
+    else:
+        image.convert('RGB').save(buffer, format='JPEG', quality=QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def placeholder(asset):
+    """A flat 16:9 tile in the asset's colour with its caption written on it."""
+    from PIL import Image, ImageDraw
+
+    size = (asset.width, asset.width * 9 // 16)
+    image = Image.new('RGB', size, asset.placeholder_color)
+    ImageDraw.Draw(image).text((size[0] / 2, size[1] / 2), asset.caption, fill='white', anchor='mm')
+    return image
+
+
+def _open(path):
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as source:
+        # Camera photos are often stored sideways with an EXIF rotation tag
+        return ImageOps.exif_transpose(source).convert('RGB')
+
+
+def _fit(image, width):
+    from PIL import Image
+
+    if image.width > width:
+        image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+    return image
+
+
+def load_image(name, assets_dir=ASSETS_DIR):
+    """Display-ready encoded bytes for image ``name`` (a key of ``IMAGES``)."""
+    asset = IMAGES[name]
+    try:
+        image = _open(assets_dir / asset.filename)
+    except OSError:
+        # Missing, unreadable or not an image
+        image = placeholder(asset)
+    return _encode(_fit(image, asset.width))
+
+
+def add_image(name, source, assets_dir=ASSETS_DIR):
+    """Store the photo ``source`` as image ``name``, scaled to its display width; returns the new path."""
+    asset = IMAGES[name]
+    path = Path(assets_dir) / asset.filename
+    _fit(_open(source), asset.width).save(path, format='JPEG', quality=85, optimize=True, progressive=True)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m seedling_model.assets',
+                                     description="Add a dashboard photo to the assets directory.")
+    parser.add_argument('name', choices=list(IMAGES), help="which dashboard image the photo is")
+    parser.add_argument('source', help="photo to scale down and store")
+    args = parser.parse_args(argv)
+    try:
+        path = add_image(args.name, args.source)
+    except OSError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(f"{args.source} stored as {path} ({path.stat().st_size / 1024:,.0f} KB)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
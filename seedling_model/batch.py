@@ -0,0 +1,65 @@
+"""Vectorized evaluation of the nursery model over arrays of scenarios."""
+
+import numpy as np
+
+from seedling_model.engine import PARAM_LIMITS, RISK_SCENARIOS, Params, Results, _financials
+
+
+def as_batch(params):
+    """Broadcast every field of ``params`` to a common float64 array shape."""
+    fields = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in params))
+    return Params._make(fields)
+
+
+def check_params(params):
+    """Broadcast ``params`` like ``as_batch``, raising ``ValueError`` if any value is NaN or outside ``PARAM_LIMITS``."""
+    batch = as_batch(params)
+    problems = []
+    for name, value in zip(Params._fields, batch):
+        low, high = PARAM_LIMITS[name]
+        invalid = ~((value >= low) & (value <= high))
+        count = np.count_nonzero(invalid)
+        if count:
+            problems.append(f"{name} must be between {low:g} and {high:g}, "
+                            f"got {value[invalid].flat[0]:g} ({count:,} invalid)")
+    if problems:
+        raise ValueError("; ".join(problems))
+    return batch
+
+
+def stack_params(param_sets):
+    """Turn a sequence of scalar ``Params`` into one ``Params`` of 1-D arrays."""
+    columns = np.array(param_sets, dtype=np.float64).reshape(-1, len(Params._fields))
+    return Params._make(columns.T)
+
+
+def simulate_batch(params, risk='No Risk'):
+    """Evaluate ``simulate`` for every scenario in ``params`` in one pass.
+
+    Each field of ``params`` may be a scalar or an array; fields are
+    broadcast against each other and every field of the returned ``Results``
+    has the broadcast shape. Scalar fields are only broadcast where they meet
+    an array, so outputs that depend on scalars alone are computed once and
+    returned as read-only broadcast views.
+    """
+    sales_factor, yield_factor = RISK_SCENARIOS[risk]
+    p = Params._make(np.asarray(v, dtype=np.float64) for v in params)
+    shape = np.broadcast_shapes(*(v.shape for v in p))
+    (capex, opex_per_cycle, total_potential_seedlings, projected_yield,
+     num_veg_seedlings, num_tree_seedlings, revenue_per_cycle,
+     profit_per_cycle, profit_per_year, adjusted_revenue,
+     adjusted_profit) = _financials(p, sales_factor, yield_factor)
+    roi_years = roi(capex, profit_per_year)
+    return Results._make(np.broadcast_to(field, shape) for field in (
+        capex, opex_per_cycle, total_potential_seedlings, projected_yield,
+        num_veg_seedlings, num_tree_seedlings, revenue_per_cycle,
+        profit_per_cycle, profit_per_year, roi_years, adjusted_revenue,
+        adjusted_profit))
+
+
+def roi(capex, profit_per_year):
+    """Payback period in years, ``inf`` wherever the nursery loses money."""
+    capex, profit_per_year = np.broadcast_arrays(capex, profit_per_year)
+    roi_years = np.full(capex.shape, np.inf)
+    np.divide(capex, profit_per_year, out=roi_years, where=profit_per_year > 0)
+    return roi_years
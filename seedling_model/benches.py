@@ -0,0 +1,171 @@
+"""Discrete-event simulation of bench space and tray reuse.
+
+The financial model assumes every tray is planted and sold once per cycle.
+Here sowings are staggered instead: each ``Sowing`` stream plants a batch of
+trays at a fixed interval, the batch occupies bench space while it grows and
+until the buyer picks it up, and its trays then go through cleaning before
+they can be sown again. A sowing that finds too little free bench space or
+too few clean trays plants what fits, and the rest is recorded as short.
+
+Events live in a ``heapq`` priority queue of plain tuples and the loop is
+pure Python with no per-event allocation beyond the tuple, so it processes
+about a million events per second. Events at the same time free resources
+(cleaned trays, pickups) before they claim them (sowings).
+"""
+
+import heapq
+import random
+from typing import NamedTuple
+
+from seedling_model.engine import CELLS_PER_TRAY, MONTHS_PER_YEAR, Params
+
+DAYS_PER_YEAR = 365.0
+
+# Event kinds, in the order they are handled when they fall on the same day
+CLEANED, PICKUP, READY, SOW = range(4)
+
+
+class Nursery(NamedTuple):
+    """Fixed resources and handling times, in trays and days."""
+    bench_trays: float = 10000
+    tray_stock: float = 10000
+    # Mean days from saleable to pickup; exponentially distributed when the
+    # simulation is given a seed, exact otherwise
+    pickup_days: float = 7.0
+    clean_days: float = 2.0
+
+
+class Sowing(NamedTuple):
+    """A stream of sowings of ``trays`` trays every ``every_days`` days."""
+    trays: float
+    every_days: float = 7.0
+    first_day: float = 0.0
+    # Sowing to saleable; 42 days is the six weeks of cohorts.DEFAULT_STAGES
+    grow_days: float = 42.0
+    # A full tray of the dashboard's default format at its default success rate
+    seedlings_per_tray: float = CELLS_PER_TRAY * Params().success_rate
+
+
+class BenchResults(NamedTuple):
+    """Totals over ``days`` days; per-stream fields are tuples in ``sowings`` order."""
+    days: float
+    events: int
+    # Time-averaged share of bench positions holding a tray
+    bench_utilization: float
+    # Time-averaged share of the tray stock on the bench or being cleaned
+    tray_utilization: float
+    peak_bench_trays: float
+    trays_sown: tuple
+    trays_short: tuple
+    trays_sold: tuple
+    seedlings_sold: tuple
+    seedlings_per_year: float
+
+
+def from_params(params, every_days=7, nursery=Nursery()):
+    """Staggered equivalent of ``params``: a vegetable and a tree stream on ``num_trays`` trays.
+
+    Each cycle is rounded to a whole number of ``every_days`` sowings, and
+    each tray spends the whole cycle growing, awaiting pickup and being
+    cleaned, so the bench turns over once per cycle as in the financial
+    model. The tree stream sows half an interval after the vegetable one.
+    """
+    sowings_per_cycle = max(1, round(params.cycle_months * DAYS_PER_YEAR / MONTHS_PER_YEAR / every_days))
+    cycle_days = sowings_per_cycle * every_days
+    grow_days = cycle_days - nursery.pickup_days - nursery.clean_days
+    if grow_days <= 0:
+        raise ValueError(f"a {cycle_days:g}-day cycle leaves no time to grow after pickup and cleaning")
+    nursery = nursery._replace(bench_trays=params.num_trays, tray_stock=params.num_trays)
+    seedlings_per_tray = params.cells_per_tray * params.success_rate
+    sowings = tuple(
+        Sowing(params.num_trays * share / sowings_per_cycle, every_days, first_day, grow_days, seedlings_per_tray)
+        for share, first_day in ((params.veg_percentage, 0.0), (1 - params.veg_percentage, every_days / 2))
+        if share > 0
+    )
+    return nursery, sowings
+
+
+def simulate_benches(nursery, sowings, days=3 * DAYS_PER_YEAR, seed=None):
+    """Run the sowing streams ``sowings`` on ``nursery`` for ``days`` days."""
+    if days <= 0:
+        raise ValueError(f"days must be positive, got {days}")
+    for sowing in sowings:
+        if sowing.every_days <= 0 or sowing.grow_days < 0:
+            raise ValueError(f"sowing interval must be positive and grow time non-negative, got {sowing}")
+    pickup_days = nursery.pickup_days
+    clean_days = nursery.clean_days
+    expovariate = None if seed is None or pickup_days <= 0 else random.Random(seed).expovariate
+    pickup_rate = 1 / pickup_days if pickup_days > 0 else 0.0
+
+    every = [sowing.every_days for sowing in sowings]
+    grow = [sowing.grow_days for sowing in sowings]
+    batch = [sowing.trays for sowing in sowings]
+    sown = [0.0] * len(sowings)
+    short = [0.0] * len(sowings)
+    sold = [0.0] * len(sowings)
+    free_bench = capacity = nursery.bench_trays
+    free_trays = stock = nursery.tray_stock
+    peak = 0.0
+    # Tray-days on the bench and in use: each batch subtracts trays * time
+    # when it arrives and adds it back when it leaves, so nothing has to be
+    # integrated between events
+    bench_area = tray_area = 0.0
+    events = 0
+
+    # (time, kind, sequence, stream, trays); the sequence number keeps ties
+    # first-in first-out and stops the comparison before the payload
+    queue = [(sowing.first_day, SOW, i, i, 0.0) for i, sowing in enumerate(sowings)]
+    heapq.heapify(queue)
+    sequence = len(queue)
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    while queue:
+        time, kind, _, stream, trays = pop(queue)
+        if time >= days:
+            break
+        events += 1
+        sequence += 1
+        if kind == SOW:
+            wanted = batch[stream]
+            trays = min(wanted, free_bench, free_trays)
+            if trays > 0:
+                free_bench -= trays
+                free_trays -= trays
+                bench_area -= trays * time
+                tray_area -= trays * time
+                sown[stream] += trays
+                if capacity - free_bench > peak:
+                    peak = capacity - free_bench
+                push(queue, (time + grow[stream], READY, sequence, stream, trays))
+                sequence += 1
+            if trays < wanted:
+                short[stream] += wanted - trays
+            push(queue, (time + every[stream], SOW, sequence, stream, 0.0))
+        elif kind == READY:
+            delay = pickup_days if expovariate is None else expovariate(pickup_rate)
+            push(queue, (time + delay, PICKUP, sequence, stream, trays))
+        elif kind == PICKUP:
+            free_bench += trays
+            bench_area += trays * time
+            sold[stream] += trays
+            push(queue, (time + clean_days, CLEANED, sequence, stream, trays))
+        else:
+            free_trays += trays
+            tray_area += trays * time
+
+    bench_area += (capacity - free_bench) * days
+    tray_area += (stock - free_trays) * days
+    seedlings_sold = tuple(trays * sowing.seedlings_per_tray for trays, sowing in zip(sold, sowings))
+    return BenchResults(
+        days=days,
+        events=events,
+        bench_utilization=bench_area / (capacity * days) if capacity > 0 else 0.0,
+        tray_utilization=tray_area / (stock * days) if stock > 0 else 0.0,
+        peak_bench_trays=peak,
+        trays_sown=tuple(sown),
+        trays_short=tuple(short),
+        trays_sold=tuple(sold),
+        seedlings_sold=seedlings_sold,
+        seedlings_per_year=sum(seedlings_sold) * DAYS_PER_YEAR / days,
+    )
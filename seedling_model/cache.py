@@ -0,0 +1,151 @@
+"""Persistent, content-addressed cache for seeded Monte Carlo runs and sweeps.
+
+Entries are compressed ``.npz`` files named by the SHA-256 of the inputs,
+the seed and ``ENGINE_VERSION``, so any process that asks the same question
+of the same engine (across server restarts and sessions) gets the stored
+answer, and a model change never serves stale results. Writes are atomic.
+Once the directory holds more than ``max_bytes`` the least recently used
+entries are deleted.
+
+The directory defaults to ``$SEEDLING_CACHE_DIR``, else
+``$XDG_CACHE_HOME/seedling_simulator`` (``~/.cache/seedling_simulator``).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from seedling_model.engine import ENGINE_VERSION, PARAM_RANGES
+from seedling_model.risk import RiskSummary, sample_adjusted_profit, summarize
+from seedling_model.sensitivity import Sweep, sweep
+
+DEFAULT_MAX_BYTES = 256 << 20
+
+
+def default_directory():
+    if 'SEEDLING_CACHE_DIR' in os.environ:
+        return Path(os.environ['SEEDLING_CACHE_DIR'])
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'seedling_simulator'
+
+
+class ResultCache:
+    """A directory of ``<key>.npz`` files bounded to ``max_bytes`` in total."""
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory) if directory is not None else default_directory()
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(kind, *parts):
+        """Hex digest identifying ``kind`` of result for JSON-serializable ``parts``."""
+        payload = json.dumps([ENGINE_VERSION, kind, *parts], separators=(',', ':'))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key):
+        return self.directory / f'{key}.npz'
+
+    def get(self, key):
+        """The arrays stored under ``key`` as a dict, or None."""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+            # Reading counts as a use for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (EOFError, OSError, ValueError, zipfile.BadZipFile):
+            # Truncated or corrupt entry; drop it and recompute
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return arrays
+
+    def put(self, key, arrays):
+        """Store a dict of arrays under ``key``, then evict down to ``max_bytes``.
+
+        The cache is best effort: if the directory can't be written the
+        entry is silently dropped.
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp', delete=False) as file:
+                try:
+                    np.savez_compressed(file, **arrays)
+                except BaseException:
+                    os.unlink(file.name)
+                    raise
+            os.replace(file.name, self._path(key))
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob('*.npz'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted by another process meanwhile
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob('*.npz'):
+            path.unlink(missing_ok=True)
+
+
+def _floats(values):
+    return [float(value) for value in values]
+
+
+def cached_monte_carlo(params, risk_model, trials=100_000, seed=None, cache=None, keep_samples=True):
+    """``risk.monte_carlo`` served from ``cache`` when the same run was done before.
+
+    Runs without a ``seed`` are not reproducible and bypass the cache. With
+    ``keep_samples=False`` only the summary is stored and ``samples`` is None.
+    """
+    if seed is None:
+        return summarize(sample_adjusted_profit(params, risk_model, trials, seed))
+    cache = ResultCache() if cache is None else cache
+    key = cache.key('monte_carlo', _floats(params), _floats(risk_model), trials, seed)
+    stored = cache.get(key)
+    if stored is not None and (not keep_samples or 'samples' in stored):
+        return RiskSummary(*(float(value) for value in stored['summary']), stored['samples'] if keep_samples else None)
+
+    summary = summarize(sample_adjusted_profit(params, risk_model, trials, seed))
+    arrays = {'summary': np.array(summary[:-1])}
+    if keep_samples:
+        arrays['samples'] = summary.samples
+    cache.put(key, arrays)
+    return summary if keep_samples else summary._replace(samples=None)
+
+
+def cached_sweep(params, names=None, ranges=PARAM_RANGES, points=21, cache=None):
+    """``sensitivity.sweep`` served from ``cache`` when the same grid was swept before."""
+    names = tuple(PARAM_RANGES if names is None else names)
+    cache = ResultCache() if cache is None else cache
+    key = cache.key('sweep', _floats(params), [[name, *_floats(ranges[name])] for name in names], points)
+    stored = cache.get(key)
+    if stored is not None:
+        return Sweep(names, stored['values'], stored['profit_per_year'], stored['roi_years'])
+
+    result = sweep(params, names, ranges, points)
+    cache.put(key, {'values': result.values, 'profit_per_year': result.profit_per_year,
+                    'roi_years': result.roi_years})
+    return result
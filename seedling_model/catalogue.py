@@ -0,0 +1,121 @@
+"""Multi-product revenue model.
+
+A ``Catalogue`` holds one array per product attribute rather than one object
+per product, so revenue and yield for every product and every scenario come
+out of a single broadcast NumPy expression. Tray allocations have shape
+(..., n_products); any catalogue column may also carry leading scenario axes
+(e.g. a (scenarios, n_products) array of prices).
+
+Trays are bench positions: a product with a two-month cycle turns each of
+its trays over six times a year. All quantities are per year.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from seedling_model.engine import cycles_per_year
+
+
+class Product(NamedTuple):
+    """One catalogue row."""
+    name: str
+    category: str
+    cells_per_tray: float
+    germination_rate: float
+    cycle_months: float
+    price: float
+    demand_cap: float = np.inf  # seedlings per year the market takes
+
+
+class Catalogue(NamedTuple):
+    """Products as columns: ``name`` and ``category`` are tuples, the rest float arrays."""
+    name: tuple
+    category: tuple
+    cells_per_tray: np.ndarray
+    germination_rate: np.ndarray
+    cycle_months: np.ndarray
+    price: np.ndarray
+    demand_cap: np.ndarray
+
+
+class CatalogueResults(NamedTuple):
+    """Per-product arrays of shape (..., n_products), and their per-scenario totals."""
+    seedlings: np.ndarray
+    sold: np.ndarray
+    revenue: np.ndarray
+    total_sold: np.ndarray
+    total_revenue: np.ndarray
+
+
+NUMERIC_FIELDS = Catalogue._fields[2:]
+
+DEFAULT_PRODUCTS = (
+    Product('Tomato', 'Vegetable', 200, 0.85, 1.5, 0.05, 600_000),
+    Product('Cabbage', 'Vegetable', 200, 0.90, 1.5, 0.04, 800_000),
+    Product('Rape', 'Vegetable', 288, 0.88, 1.0, 0.03, 400_000),
+    Product('Onion', 'Vegetable', 288, 0.80, 2.0, 0.03, 500_000),
+    Product('Green Pepper', 'Vegetable', 200, 0.75, 2.0, 0.06, 300_000),
+    Product('Pine', 'Tree', 128, 0.70, 6.0, 0.20, 50_000),
+    Product('Eucalyptus', 'Tree', 128, 0.75, 4.0, 0.15, 80_000),
+    Product('Mango', 'Tree', 50, 0.80, 6.0, 1.00, 10_000),
+    Product('Citrus', 'Tree', 50, 0.70, 9.0, 1.20, 5_000),
+)
+
+
+def stack_products(products):
+    """Turn a sequence of ``Product`` rows into one columnar ``Catalogue``."""
+    products = [Product(*row) for row in products]
+    columns = np.array([row[2:] for row in products], dtype=np.float64).reshape(-1, len(NUMERIC_FIELDS))
+    return Catalogue(tuple(row.name for row in products), tuple(row.category for row in products), *columns.T)
+
+
+DEFAULT_CATALOGUE = stack_products(DEFAULT_PRODUCTS)
+
+
+def from_params(params):
+    """The two-product (vegetable, tree) catalogue and tray split equivalent to ``params``.
+
+    ``simulate_catalogue`` of the result reproduces ``simulate``'s revenue
+    per cycle times its cycles per year. Batched ``params`` give a batch of
+    catalogues along the leading axes.
+    """
+    def both(value):
+        # The same value for the vegetable and the tree column
+        value = np.asarray(value, dtype=np.float64)
+        return np.stack([value, value], axis=-1)
+
+    veg_percentage = np.asarray(params.veg_percentage, dtype=np.float64)
+    price = np.stack(np.broadcast_arrays(params.avg_price_veg, params.avg_price_tree), axis=-1)
+    catalogue = Catalogue(
+        ('Vegetable', 'Tree'), ('Vegetable', 'Tree'),
+        both(params.cells_per_tray),
+        both(params.success_rate),
+        both(params.cycle_months),
+        price.astype(np.float64),
+        np.full(2, np.inf),
+    )
+    trays = np.asarray(params.num_trays, dtype=np.float64)[..., None] * np.stack(
+        [veg_percentage, 1 - veg_percentage], axis=-1)
+    return catalogue, trays
+
+
+def simulate_catalogue(catalogue, trays, yield_factor=1.0, sales_factor=1.0):
+    """Yearly yield, sales and revenue of every product for every tray allocation.
+
+    ``trays`` has shape (..., n_products) and broadcasts against the
+    catalogue columns. Sales are the harvest capped at each product's demand;
+    ``yield_factor`` scales the harvest and ``sales_factor`` the demand.
+    """
+    trays = np.asarray(trays, dtype=np.float64)
+    turns = cycles_per_year(catalogue)
+    seedlings = trays * (catalogue.cells_per_tray * catalogue.germination_rate * turns * yield_factor)
+    sold = np.minimum(seedlings, catalogue.demand_cap * sales_factor)
+    revenue = sold * catalogue.price
+    return CatalogueResults(seedlings, sold, revenue, sold.sum(axis=-1), revenue.sum(axis=-1))
+
+
+def category_totals(catalogue, values):
+    """Sum ``values`` (..., n_products) per category, as {category: array}."""
+    category = np.asarray(catalogue.category)
+    return {name: values[..., category == name].sum(axis=-1) for name in dict.fromkeys(catalogue.category)}
@@ -0,0 +1,118 @@
+"""Plotly figures for the dashboard.
+
+Import this module only when a chart is about to be drawn: Plotly dominates
+the app's start-up time and headless users never need it.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from seedling_model.timing import section
+
+
+# Figures are built from plain arrays with graph_objects; going through a
+# pandas DataFrame and plotly.express costs more than the chart itself for a
+# handful of points.
+#
+# The dashboard charts are split into a skeleton (traces, layout, the CAPEX
+# line, colours) and a patch step that only swaps in the data. A long-lived
+# skeleton from *_template() can be patched and re-rendered on every rerun
+# instead of being rebuilt; copying a figure costs about as much as building
+# it, so share the one skeleton and serialize access to it. Builders and
+# patchers take an optional timing.SectionTimer.
+
+REVENUE_MIX_COLORS = {'Vegetable': '#2ca02c', 'Tree': '#8c564b'}
+
+
+def profit_template():
+    """An empty profit projection figure for ``patch_profit_figure``."""
+    fig = go.Figure(
+        go.Scatter(mode='lines+markers', name='Cumulative Profit ($)'),
+        layout=dict(xaxis_title='Year', yaxis_title='Cumulative Profit ($)'),
+    )
+    # Add a line for the initial investment
+    fig.add_hline(y=0, line_dash="dot", annotation_text="Initial Investment (CAPEX)", annotation_position="bottom right")
+    return fig
+
+
+def revenue_mix_template():
+    """An empty revenue mix figure for ``patch_revenue_mix_figure``."""
+    return go.Figure(go.Pie(
+        labels=list(REVENUE_MIX_COLORS),
+        hole=0.4,
+        marker_colors=list(REVENUE_MIX_COLORS.values()),
+        sort=False,
+    ))
+
+
+def patch_profit_figure(fig, year, cumulative_profit, capex, years, timer=None):
+    """Swap new projection data and CAPEX level into a ``profit_template`` figure."""
+    with section(timer, "Chart data preparation"):
+        year = np.asarray(year)
+        cumulative_profit = np.asarray(cumulative_profit)
+    with section(timer, "Plotly figure build"), fig.batch_update():
+        fig.data[0].x = year
+        fig.data[0].y = cumulative_profit
+        fig.layout.title.text = f"{years}-Year Cumulative Profit Projection"
+        fig.layout.shapes[0].y0 = fig.layout.shapes[0].y1 = capex
+        fig.layout.annotations[0].y = capex
+    return fig
+
+
+def patch_revenue_mix_figure(fig, veg_revenue, tree_revenue, timer=None):
+    """Swap new revenue values into a ``revenue_mix_template`` figure."""
+    with section(timer, "Plotly figure build"):
+        fig.data[0].values = [veg_revenue, tree_revenue]
+    return fig
+
+
+def profit_figure(year, cumulative_profit, capex, years, timer=None):
+    with section(timer, "Plotly figure build"):
+        fig = profit_template()
+    return patch_profit_figure(fig, year, cumulative_profit, capex, years, timer)
+
+
+def revenue_mix_figure(veg_revenue, tree_revenue, timer=None):
+    with section(timer, "Plotly figure build"):
+        fig = revenue_mix_template()
+    return patch_revenue_mix_figure(fig, veg_revenue, tree_revenue, timer)
+
+
+def scenario_comparison_figure(names, year, cumulative_profit, timer=None):
+    """Cumulative profit of every compared scenario, overlaid on one chart."""
+    with section(timer, "Plotly figure build"):
+        fig = go.Figure([
+            go.Scatter(x=x, y=y, mode='lines', name=name)
+            for name, x, y in zip(names, year, cumulative_profit)
+        ])
+        fig.update_layout(title="Cumulative Profit by Scenario", xaxis_title='Year',
+                          yaxis_title='Cumulative Profit ($)', hovermode='x unified')
+    return fig
+
+
+def tornado_figure(result, metric, labels, timer=None):
+    """Tornado chart of a ``sensitivity.Tornado`` for ``metric`` 'profit' or 'roi'.
+
+    Returns None for 'roi' when the current inputs never pay back, as there
+    is no base payback period to draw the bars from.
+    """
+    if metric == 'profit':
+        base, low, high = result.base_profit_per_year, result.profit_low, result.profit_high
+        title, axis = "Impact on Annual Profit", "Profit/Year ($)"
+    elif np.isinf(result.base_roi_years):
+        return None
+    else:
+        # Loss-making ends of a range have no payback period; leave those bars out
+        base = result.base_roi_years
+        low = np.where(np.isinf(result.roi_low), np.nan, result.roi_low)
+        high = np.where(np.isinf(result.roi_high), np.nan, result.roi_high)
+        title, axis = "Impact on Payback Period", "ROI (years)"
+    labels = [labels[name] for name in result.names]
+    with section(timer, "Plotly figure build"):
+        fig = go.Figure([
+            go.Bar(y=labels, x=low - base, base=base, orientation='h', name="Input at minimum", marker_color='#d62728'),
+            go.Bar(y=labels, x=high - base, base=base, orientation='h', name="Input at maximum", marker_color='#2ca02c'),
+        ])
+        fig.update_layout(title=title, barmode='overlay', xaxis_title=axis, yaxis_autorange='reversed')
+        fig.add_vline(x=base, line_dash="dot", annotation_text="Current inputs")
+    return fig
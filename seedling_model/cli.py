@@ -0,0 +1,182 @@
+"""Headless batch runs: ``python -m seedling_simulator run --input X --output Y``.
+
+Scenario files are CSV or Parquet with one column per ``Params`` field, in
+model units (rates as fractions). Missing columns take the dashboard
+defaults, and a chunk with a value outside ``PARAM_LIMITS`` stops the run.
+Rows are streamed through the batch engine in chunks, so the input never
+has to fit in memory. The output is written to a temporary file that only
+replaces ``--output`` once every row has been evaluated.
+
+With ``--workers N`` each chunk is split evenly across N processes. Every
+chunk pays a fixed cost of about 2 ms for the round trip to the pool, plus
+the shared memory copy per row (see ``simulate_parallel``), so workers need
+chunks of at least 100,000 rows and more free cores than the copy's share of
+the work to come out ahead.
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from seedling_model.batch import check_params, simulate_batch
+from seedling_model.engine import RISK_SCENARIOS, Params
+from seedling_model.executor import simulate_parallel
+
+OUTPUT_COLUMNS = ('capex', 'opex_per_cycle', 'revenue_per_cycle', 'profit_per_year', 'roi_years',
+                  'adjusted_profit')
+DEFAULT_CHUNK_SIZE = 250_000
+CSV_BLOCK_BYTES = 32 << 20
+
+
+def _format(path):
+    suffix = Path(path).suffix.lower()
+    if suffix in ('.parquet', '.pq'):
+        return 'parquet'
+    if suffix == '.csv':
+        return 'csv'
+    raise ValueError(f"{path}: expected a .csv or .parquet file")
+
+
+def read_batches(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield record batches of at most ``chunk_size`` rows from a scenario file."""
+    if _format(path) == 'parquet':
+        yield from pq.ParquetFile(path).iter_batches(batch_size=chunk_size)
+        return
+    # Parameter columns are always read as floats; inferred from the first
+    # block, a column of whole numbers would reject a later 5000.5
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+        convert_options=pa_csv.ConvertOptions(column_types={name: pa.float64() for name in Params._fields}),
+    )
+    for batch in reader:
+        for offset in range(0, batch.num_rows, chunk_size):
+            yield batch.slice(offset, chunk_size)
+
+
+def evaluate_batch(batch, risk='No Risk', executor=None, workers=1):
+    """Append the model outputs to a record batch of scenarios.
+
+    With a process pool ``executor`` the chunk is split into one shard per
+    worker, ``workers`` being the pool size.
+    """
+    defaults = Params()
+    params = Params._make(
+        batch.column(name).to_numpy(zero_copy_only=False).astype(np.float64)
+        if name in batch.schema.names else getattr(defaults, name)
+        for name in Params._fields
+    )
+    check_params(params)
+    if executor is None:
+        results = simulate_batch(params, risk)._asdict()
+    else:
+        shard_size = max(math.ceil(batch.num_rows / workers), 1)
+        results = simulate_parallel(params, risk, OUTPUT_COLUMNS, shard_size=shard_size, executor=executor)
+    shape = (batch.num_rows,)
+    columns = list(batch.columns)
+    names = list(batch.schema.names)
+    for name in OUTPUT_COLUMNS:
+        columns.append(pa.array(np.broadcast_to(results[name], shape)))
+        names.append(name)
+    return pa.RecordBatch.from_arrays(columns, names=names)
+
+
+class _Writer:
+    def __init__(self, path, format):
+        self.path = path
+        self.format = format
+        self.writer = None
+
+    def write(self, batch):
+        if self.writer is None:
+            if self.format == 'parquet':
+                self.writer = pq.ParquetWriter(self.path, batch.schema)
+            else:
+                self.writer = pa_csv.CSVWriter(self.path, batch.schema)
+        self.writer.write_batch(batch)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def run(input_path, output_path, chunk_size=DEFAULT_CHUNK_SIZE, risk='No Risk', workers=1):
+    """Evaluate every scenario in ``input_path`` and write them to ``output_path``.
+
+    Returns the number of rows processed.
+    """
+    output_format = _format(output_path)
+    output_path = Path(output_path)
+    handle, temporary = tempfile.mkstemp(dir=output_path.parent, prefix=f'.{output_path.name}.', suffix='.tmp')
+    os.close(handle)
+    writer = _Writer(temporary, output_format)
+    rows = 0
+    try:
+        with ExitStack() as stack:
+            stack.callback(writer.close)
+            executor = stack.enter_context(ProcessPoolExecutor(workers)) if workers > 1 else None
+            for batch in read_batches(input_path, chunk_size):
+                try:
+                    output = evaluate_batch(batch, risk, executor, workers)
+                except ValueError as exc:
+                    raise ValueError(f"{input_path}, rows {rows:,}-{rows + batch.num_rows - 1:,}: {exc}") from exc
+                writer.write(output)
+                rows += batch.num_rows
+    except BaseException:
+        # Never leave a truncated output behind
+        os.unlink(temporary)
+        raise
+    if writer.writer is None:
+        # Empty input: nothing to write
+        os.unlink(temporary)
+    else:
+        os.replace(temporary, output_path)
+    return rows
+
+
+def _positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        value = None
+    if value is None or value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {text!r}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='seedling_simulator', description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="evaluate a CSV/Parquet file of scenarios")
+    run_parser.add_argument('--input', required=True, help="scenario file (.csv or .parquet)")
+    run_parser.add_argument('--output', required=True, help="results file (.csv or .parquet)")
+    run_parser.add_argument('--chunk-size', type=_positive_int, default=DEFAULT_CHUNK_SIZE,
+                            help="rows evaluated per chunk (default: %(default)s)")
+    run_parser.add_argument('--risk', choices=list(RISK_SCENARIOS), default='No Risk',
+                            help="deterministic risk scenario to apply")
+    run_parser.add_argument('--workers', type=_positive_int, default=1,
+                            help="worker processes each chunk is split across (default: %(default)s)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == 'run':
+        try:
+            rows = run(args.input, args.output, args.chunk_size, args.risk, args.workers)
+        except (OSError, ValueError, pa.ArrowException) as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+        print(f"{rows:,} scenarios written to {args.output}", file=sys.stderr)
+    return 0
@@ -0,0 +1,150 @@
+"""Core nursery financial model.
+
+Pure Python, no third-party imports: this module is safe to import from
+headless jobs, benchmarks and worker processes.
+"""
+
+from typing import NamedTuple
+
+# Bump whenever a change alters model outputs for unchanged inputs: results
+# persisted by seedling_model.cache are keyed on it.
+ENGINE_VERSION = 2
+
+# --- MODEL CONSTANTS ---
+
+MONTHS_PER_YEAR = 12
+
+# Defaults for Params.cells_per_tray and Params.cycle_months. Labor is paid
+# for every month of a cycle.
+CELLS_PER_TRAY = 200
+LABOR_MONTHS_PER_CYCLE = 3
+CYCLES_PER_YEAR = MONTHS_PER_YEAR // LABOR_MONTHS_PER_CYCLE
+
+# Common plug tray formats: the dashboard's choices for Params.cells_per_tray,
+# whose sweep range in PARAM_RANGES spans them.
+TRAY_FORMATS = (72, 128, 200, 288)
+
+# Deterministic risk scenarios offered by the dashboard, as
+# (sales multiplier, yield multiplier).
+RISK_SCENARIOS = {
+    'No Risk': (1.0, 1.0),
+    'Drought (-20% sales)': (0.80, 1.0),
+    'Pest Outbreak (-15% yield)': (1.0, 0.85),
+}
+
+
+class Params(NamedTuple):
+    """Sidebar inputs, in model units (rates are fractions, not percent)."""
+    greenhouse_cost: float = 3000
+    irrigation_cost: float = 2500
+    tools_cost: float = 2000
+    labor_cost_per_month: float = 750
+    seed_cost_per_cycle: float = 1000
+    medium_cost_per_cycle: float = 800
+    num_trays: float = 10000
+    success_rate: float = 0.85
+    avg_price_veg: float = 0.05
+    avg_price_tree: float = 0.15
+    veg_percentage: float = 0.70
+    cells_per_tray: float = CELLS_PER_TRAY
+    cycle_months: float = LABOR_MONTHS_PER_CYCLE
+
+
+# Slider range of every input, in model units.
+PARAM_RANGES = {
+    'greenhouse_cost': (1000, 10000),
+    'irrigation_cost': (500, 5000),
+    'tools_cost': (500, 5000),
+    'labor_cost_per_month': (200, 2000),
+    'seed_cost_per_cycle': (200, 3000),
+    'medium_cost_per_cycle': (200, 2000),
+    'num_trays': (5000, 20000),
+    'success_rate': (0.50, 1.00),
+    'avg_price_veg': (0.01, 0.20),
+    'avg_price_tree': (0.05, 0.50),
+    'veg_percentage': (0.0, 1.0),
+    'cells_per_tray': (TRAY_FORMATS[0], TRAY_FORMATS[-1]),
+    'cycle_months': (1.0, 6.0),
+}
+
+# Values outside these (inclusive) bounds make no sense for the model at all,
+# as opposed to PARAM_RANGES, which only bounds the dashboard inputs.
+PARAM_LIMITS = {
+    'greenhouse_cost': (0.0, float('inf')),
+    'irrigation_cost': (0.0, float('inf')),
+    'tools_cost': (0.0, float('inf')),
+    'labor_cost_per_month': (0.0, float('inf')),
+    'seed_cost_per_cycle': (0.0, float('inf')),
+    'medium_cost_per_cycle': (0.0, float('inf')),
+    'num_trays': (0.0, float('inf')),
+    'success_rate': (0.0, 1.0),
+    'avg_price_veg': (0.0, float('inf')),
+    'avg_price_tree': (0.0, float('inf')),
+    'veg_percentage': (0.0, 1.0),
+    'cells_per_tray': (1.0, float('inf')),
+    'cycle_months': (0.5, MONTHS_PER_YEAR),
+}
+
+
+class Results(NamedTuple):
+    capex: float
+    opex_per_cycle: float
+    total_potential_seedlings: float
+    projected_yield: float
+    num_veg_seedlings: float
+    num_tree_seedlings: float
+    revenue_per_cycle: float
+    profit_per_cycle: float
+    profit_per_year: float
+    roi_years: float
+    adjusted_revenue: float
+    adjusted_profit: float
+
+
+def cycles_per_year(params):
+    """Growing cycles per year; fractional when the cycle length doesn't divide a year."""
+    return MONTHS_PER_YEAR / params.cycle_months
+
+
+def _financials(p, sales_factor=1.0, yield_factor=1.0):
+    # Plain arithmetic only, so the same code serves scalars and arrays.
+
+    # 1. Costing Calculation
+    capex = p.greenhouse_cost + p.irrigation_cost + p.tools_cost
+    opex_per_cycle = (p.labor_cost_per_month * p.cycle_months) + p.seed_cost_per_cycle + p.medium_cost_per_cycle
+
+    # 2. Yield Calculation
+    total_potential_seedlings = p.num_trays * p.cells_per_tray
+    projected_yield = total_potential_seedlings * p.success_rate
+
+    # 3. Revenue Calculation
+    num_veg_seedlings = projected_yield * p.veg_percentage
+    num_tree_seedlings = projected_yield * (1 - p.veg_percentage)
+    revenue_per_cycle = (num_veg_seedlings * p.avg_price_veg) + (num_tree_seedlings * p.avg_price_tree)
+
+    # 4. Profitability Calculation
+    profit_per_cycle = revenue_per_cycle - opex_per_cycle
+    cycles = cycles_per_year(p)
+    profit_per_year = profit_per_cycle * cycles
+
+    # 5. Risk Adjustment
+    adjusted_revenue = revenue_per_cycle * sales_factor * yield_factor
+    adjusted_profit = (adjusted_revenue - opex_per_cycle) * cycles
+
+    return (capex, opex_per_cycle, total_potential_seedlings, projected_yield,
+            num_veg_seedlings, num_tree_seedlings, revenue_per_cycle,
+            profit_per_cycle, profit_per_year, adjusted_revenue, adjusted_profit)
+
+
+def simulate(params, risk='No Risk'):
+    """Evaluate the model for one parameter set and a named risk scenario."""
+    sales_factor, yield_factor = RISK_SCENARIOS[risk]
+    (capex, opex_per_cycle, total_potential_seedlings, projected_yield,
+     num_veg_seedlings, num_tree_seedlings, revenue_per_cycle,
+     profit_per_cycle, profit_per_year, adjusted_revenue,
+     adjusted_profit) = _financials(params, sales_factor, yield_factor)
+    roi_years = capex / profit_per_year if profit_per_year > 0 else float('inf')
+    return Results(capex, opex_per_cycle, total_potential_seedlings,
+                   projected_yield, num_veg_seedlings, num_tree_seedlings,
+                   revenue_per_cycle, profit_per_cycle, profit_per_year,
+                   roi_years, adjusted_revenue, adjusted_profit)
@@ -0,0 +1,73 @@
+"""Monte Carlo risk engine.
+
+Droughts and pest outbreaks are sampled independently for every growing
+cycle of every trial: whether an event happens is a Bernoulli draw with the
+configured per-cycle probability, and how bad it is comes from a Beta
+distribution with the configured mean loss.
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from seedling_model.engine import cycles_per_year, simulate
+
+
+class RiskModel(NamedTuple):
+    """Per-cycle event probabilities and mean losses (all fractions)."""
+    drought_probability: float = 0.15
+    drought_sales_loss: float = 0.20
+    pest_probability: float = 0.10
+    pest_yield_loss: float = 0.15
+    # Beta concentration (alpha + beta); higher means less spread around the mean loss.
+    severity_concentration: float = 20.0
+
+
+class RiskSummary(NamedTuple):
+    mean: float
+    p5: float
+    p50: float
+    p95: float
+    probability_of_loss: float
+    samples: np.ndarray
+
+
+def _severity(rng, mean, concentration, size):
+    if mean <= 0:
+        return np.zeros(size)
+    if mean >= 1:
+        return np.ones(size)
+    return rng.beta(mean * concentration, (1 - mean) * concentration, size)
+
+
+def sample_adjusted_profit(params, risk_model=RiskModel(), trials=100_000, seed=None):
+    """Draw ``trials`` samples of annual ``adjusted_profit`` for one scenario."""
+    results = simulate(params)
+    rng = np.random.default_rng(seed)
+    cycles = cycles_per_year(params)
+    # A year that ends part-way through a cycle counts that cycle's share of it
+    weights = np.ones(math.ceil(cycles))
+    weights[-1] = cycles - (weights.size - 1)
+    shape = (trials, weights.size)
+
+    drought = rng.random(shape) < risk_model.drought_probability
+    pest = rng.random(shape) < risk_model.pest_probability
+    sales_factor = 1 - drought * _severity(rng, risk_model.drought_sales_loss,
+                                           risk_model.severity_concentration, shape)
+    yield_factor = 1 - pest * _severity(rng, risk_model.pest_yield_loss,
+                                        risk_model.severity_concentration, shape)
+
+    revenue_share = (sales_factor * yield_factor) @ weights
+    return results.revenue_per_cycle * revenue_share - results.opex_per_cycle * cycles
+
+
+def summarize(samples):
+    p5, p50, p95 = np.percentile(samples, [5, 50, 95])
+    return RiskSummary(float(samples.mean()), float(p5), float(p50), float(p95),
+                       float((samples < 0).mean()), samples)
+
+
+def monte_carlo(params, risk_model=RiskModel(), trials=100_000, seed=None):
+    """Run the risk simulation and summarize the ``adjusted_profit`` distribution."""
+    return summarize(sample_adjusted_profit(params, risk_model, trials, seed))
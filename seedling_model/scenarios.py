@@ -0,0 +1,166 @@
+"""Named parameter sets compared side by side.
+
+A ``ScenarioStore`` maps scenario names to ``Params`` and can be saved to
+and loaded from a JSON file that several sessions share: ``save`` re-reads
+the file under a lock and applies only this store's own additions and
+removals, so it never drops scenarios another session saved in the
+meantime. ``compare`` evaluates every scenario it hasn't
+seen with the same parameters and horizon before in one ``simulate_batch``
+call (plus one ``simulate_cycles`` call per cycle length), and reuses the
+stored rows for the rest.
+"""
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from seedling_model.batch import check_params, simulate_batch, stack_params
+from seedling_model.engine import Params, Results
+from seedling_model.timeseries import simulate_cycles
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: saves still merge, but two at the same instant can race
+    fcntl = None
+
+SCENARIOS_PATH = Path(__file__).resolve().parent.parent / 'scenarios.json'
+FORMAT_VERSION = 1
+
+
+class Comparison(NamedTuple):
+    """Outputs for ``names`` in order.
+
+    ``results`` fields have shape (len(names),). Scenarios with different
+    cycle lengths have curves on different year grids, so ``year`` and
+    ``cumulative_profit`` hold one array per scenario.
+    """
+    names: tuple
+    results: Results
+    year: tuple
+    cumulative_profit: tuple
+
+
+class ScenarioStore:
+    """An ordered collection of named ``Params`` with memoized evaluation."""
+
+    def __init__(self, scenarios=None):
+        self.scenarios = dict(scenarios or {})
+        # Name -> Params, or None if removed, for changes not saved yet
+        self._changes = dict(self.scenarios)
+        # (params, years) -> (Results row, year, cumulative_profit)
+        self._evaluated = {}
+        self.last_evaluated = 0
+
+    def __len__(self):
+        return len(self.scenarios)
+
+    def __iter__(self):
+        return iter(self.scenarios)
+
+    def __contains__(self, name):
+        return name in self.scenarios
+
+    def put(self, name, params):
+        """Add scenario ``name``, or replace its parameters."""
+        check_params(params)
+        self.scenarios[name] = self._changes[name] = Params._make(float(value) for value in params)
+
+    def remove(self, name):
+        del self.scenarios[name]
+        self._changes[name] = None
+
+    def compare(self, names=None, years=5):
+        """Evaluate the scenarios ``names`` (default: all) over a ``years`` projection."""
+        names = tuple(self.scenarios if names is None else names)
+        keys = [(self.scenarios[name], years) for name in names]
+        missing = list(dict.fromkeys(key for key in keys if key not in self._evaluated))
+        self.last_evaluated = len(missing)
+        if missing:
+            self._evaluate([params for params, _ in missing], years)
+        # Forget scenarios that were edited, removed or left out
+        self._evaluated = {key: self._evaluated[key] for key in keys}
+
+        rows = [self._evaluated[key] for key in keys]
+        results = Results._make(np.array([row[0] for row in rows]).reshape(len(rows), len(Results._fields)).T)
+        return Comparison(names, results, tuple(row[1] for row in rows), tuple(row[2] for row in rows))
+
+    def _evaluate(self, param_sets, years):
+        batch = stack_params(param_sets)
+        results = np.column_stack(simulate_batch(batch))
+        # The projection grid needs one cycle length per simulate_cycles call
+        for cycle_months in np.unique(batch.cycle_months):
+            index = np.flatnonzero(batch.cycle_months == cycle_months)
+            series = simulate_cycles(Params._make(field[index] for field in batch), years)
+            for row, i in enumerate(index):
+                self._evaluated[param_sets[i], years] = (results[i], series.year, series.cumulative_profit[row])
+
+    def save(self, path=SCENARIOS_PATH):
+        """Apply this store's unsaved changes to the scenarios in ``path``.
+
+        The file is re-read under a lock and replaced atomically, and the
+        store then holds the merged scenarios, including any saved by other
+        sessions since it was loaded.
+        """
+        path = Path(path)
+        with _locked(path):
+            scenarios = _read(path) if path.exists() else {}
+            for name, params in self._changes.items():
+                if params is None:
+                    scenarios.pop(name, None)
+                else:
+                    scenarios[name] = params
+            with tempfile.NamedTemporaryFile('w', dir=path.parent, suffix='.tmp', delete=False) as file:
+                try:
+                    json.dump({
+                        'version': FORMAT_VERSION,
+                        'scenarios': {name: params._asdict() for name, params in scenarios.items()},
+                    }, file, indent=2)
+                    file.write('\n')
+                except BaseException:
+                    os.unlink(file.name)
+                    raise
+            os.replace(file.name, path)
+        self.scenarios = scenarios
+        self._changes = {}
+
+    @classmethod
+    def load(cls, path=SCENARIOS_PATH):
+        """Read a store written by ``save``; fields missing from the file take the ``Params`` defaults."""
+        store = cls()
+        store.scenarios = _read(Path(path))
+        return store
+
+
+@contextmanager
+def _locked(path):
+    """Hold an exclusive lock on ``path``'s lock file (a no-op without ``fcntl``)."""
+    if fcntl is None:
+        yield
+        return
+    with open(path.with_name(path.name + '.lock'), 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read(path):
+    data = json.loads(path.read_text())
+    if data.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported scenario file version {data.get('version')!r}")
+    scenarios = {}
+    for name, fields in data['scenarios'].items():
+        unknown = set(fields) - set(Params._fields)
+        if unknown:
+            raise ValueError(f"{path}: scenario {name!r} has unknown fields {sorted(unknown)}")
+        params = Params(**fields)
+        check_params(params)
+        scenarios[name] = Params._make(float(value) for value in params)
+    return scenarios
@@ -0,0 +1,71 @@
+"""One-at-a-time parameter sweeps and tornado summaries.
+
+All points of a sweep are stacked into a single batch and evaluated with one
+``simulate_batch`` call.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from seedling_model.batch import simulate_batch
+from seedling_model.engine import PARAM_RANGES, Params, simulate
+
+
+class Sweep(NamedTuple):
+    """Model outputs with each input swept while the others stay at base.
+
+    ``values``, ``profit_per_year`` and ``roi_years`` have shape
+    (len(names), points).
+    """
+    names: tuple
+    values: np.ndarray
+    profit_per_year: np.ndarray
+    roi_years: np.ndarray
+
+
+class Tornado(NamedTuple):
+    """Outputs with each input at the bottom and top of its range, largest swing first."""
+    names: tuple
+    base_profit_per_year: float
+    base_roi_years: float
+    low_value: np.ndarray
+    high_value: np.ndarray
+    profit_low: np.ndarray
+    profit_high: np.ndarray
+    roi_low: np.ndarray
+    roi_high: np.ndarray
+
+
+def sweep(params, names=None, ranges=PARAM_RANGES, points=21):
+    """Sweep each input in ``names`` across its range, holding the rest at ``params``."""
+    names = tuple(PARAM_RANGES if names is None else names)
+    columns = np.tile(np.asarray(params, dtype=np.float64), (len(names) * points, 1))
+    values = np.empty((len(names), points))
+    for i, name in enumerate(names):
+        low, high = ranges[name]
+        values[i] = np.linspace(low, high, points)
+        columns[i * points:(i + 1) * points, Params._fields.index(name)] = values[i]
+
+    results = simulate_batch(Params._make(columns.T))
+    shape = (len(names), points)
+    return Sweep(names, values, results.profit_per_year.reshape(shape),
+                 results.roi_years.reshape(shape))
+
+
+def tornado(params, names=None, ranges=PARAM_RANGES):
+    """Rank inputs by how far moving them across their range shifts ``profit_per_year``."""
+    swept = sweep(params, names, ranges, points=2)
+    base = simulate(params)
+    order = np.argsort(-np.abs(swept.profit_per_year[:, 1] - swept.profit_per_year[:, 0]))
+    return Tornado(
+        names=tuple(swept.names[i] for i in order),
+        base_profit_per_year=base.profit_per_year,
+        base_roi_years=base.roi_years,
+        low_value=swept.values[order, 0],
+        high_value=swept.values[order, 1],
+        profit_low=swept.profit_per_year[order, 0],
+        profit_high=swept.profit_per_year[order, 1],
+        roi_low=swept.roi_years[order, 0],
+        roi_high=swept.roi_years[order, 1],
+    )
@@ -0,0 +1,86 @@
+"""Inverse questions: what input is needed to pay back CAPEX within a target?
+
+Revenue is linear in ``success_rate``, ``avg_price_veg`` and ``num_trays``,
+so those are inverted in closed form. ``solve_for`` handles any other input
+with a vectorized bisection over its slider range. Every function accepts
+batches of parameters and targets and broadcasts them together.
+"""
+
+import numpy as np
+
+from seedling_model.batch import as_batch, simulate_batch
+from seedling_model.engine import PARAM_RANGES, Params, _financials, cycles_per_year
+
+
+def _required_revenue(p, target_roi_years):
+    capex, opex_per_cycle = _financials(p)[:2]
+    return capex / (np.asarray(target_roi_years, dtype=np.float64) * cycles_per_year(p)) + opex_per_cycle
+
+
+def _mix_price(p):
+    return p.veg_percentage * p.avg_price_veg + (1 - p.veg_percentage) * p.avg_price_tree
+
+
+def _divide(numerator, denominator):
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    out = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def min_success_rate(params, target_roi_years):
+    """Lowest success rate that pays back CAPEX in ``target_roi_years``; NaN if above 100%."""
+    p = as_batch(params)
+    rate = _divide(_required_revenue(p, target_roi_years), p.num_trays * p.cells_per_tray * _mix_price(p))
+    rate = np.maximum(rate, 0.0)
+    return np.where(rate <= 1.0, rate, np.nan)
+
+
+def min_avg_price_veg(params, target_roi_years):
+    """Lowest vegetable seedling price that pays back CAPEX in ``target_roi_years``.
+
+    NaN where there are no vegetable seedlings to price.
+    """
+    p = as_batch(params)
+    price_needed = _divide(_required_revenue(p, target_roi_years), p.num_trays * p.cells_per_tray * p.success_rate)
+    return np.maximum(_divide(price_needed - (1 - p.veg_percentage) * p.avg_price_tree, p.veg_percentage), 0.0)
+
+
+def min_num_trays(params, target_roi_years):
+    """Fewest whole trays that pay back CAPEX in ``target_roi_years``.
+
+    NaN where a tray earns nothing, e.g. a zero success rate or mix price.
+    """
+    p = as_batch(params)
+    trays = _divide(_required_revenue(p, target_roi_years), p.cells_per_tray * p.success_rate * _mix_price(p))
+    return np.maximum(np.ceil(trays), 0.0)
+
+
+def solve_for(name, params, target_roi_years, bounds=None, iterations=60):
+    """Value of input ``name`` at which the payback period equals ``target_roi_years``.
+
+    Searches ``bounds`` (default: the slider range) by bisection on
+    ``profit_per_year * target - capex``, which must change sign across the
+    bounds; NaN is returned where it doesn't.
+    """
+    low, high = PARAM_RANGES[name] if bounds is None else bounds
+    index = Params._fields.index(name)
+    p = as_batch(params)
+    target, *fields = np.broadcast_arrays(np.asarray(target_roi_years, dtype=np.float64), *p)
+    fields = [field.copy() for field in fields]
+
+    def residual(value):
+        fields[index] = value
+        results = simulate_batch(Params._make(fields))
+        return results.profit_per_year * target - results.capex
+
+    lo = np.full(target.shape, float(low))
+    hi = np.full(target.shape, float(high))
+    r_lo = residual(lo)
+    bracketed = np.sign(r_lo) != np.sign(residual(hi))
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        same_side = np.sign(residual(mid)) == np.sign(r_lo)
+        lo = np.where(same_side, mid, lo)
+        hi = np.where(same_side, hi, mid)
+    return np.where(bracketed, (lo + hi) / 2, np.nan)
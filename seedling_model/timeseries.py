@@ -0,0 +1,194 @@
+"""Cycle-by-cycle projection of the nursery over a multi-year horizon.
+
+Every scenario is projected over the same grid of growing cycles, so a
+whole batch is one set of (scenarios, cycles) array operations. That grid
+needs one cycle length, so all scenarios of a call share ``cycle_months``.
+"""
+
+import itertools
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from seedling_model.batch import as_batch
+from seedling_model.engine import CYCLES_PER_YEAR, MONTHS_PER_YEAR, _financials
+
+MAX_YEARS = 30
+
+# Revenue multiplier for each cycle of the year, or a single factor for
+# every cycle; flat by default so the projection agrees with the annual
+# figures on the dashboard.
+FLAT_SEASONALITY = (1.0,)
+
+
+class CycleSeries(NamedTuple):
+    """Per-cycle cash flows; money fields have shape (*scenarios, cycles)."""
+    cycle: np.ndarray
+    year: np.ndarray
+    revenue: np.ndarray
+    opex: np.ndarray
+    profit: np.ndarray
+    depreciation: np.ndarray
+    net_income: np.ndarray
+    cumulative_profit: np.ndarray
+    cash_balance: np.ndarray
+    book_value: np.ndarray
+
+
+class CycleStep(NamedTuple):
+    """One cycle of ``iter_cycles``; money fields have the scenario shape."""
+    cycle: int
+    year: float
+    revenue: np.ndarray
+    opex: np.ndarray
+    profit: np.ndarray
+    depreciation: np.ndarray
+    net_income: np.ndarray
+    cumulative_profit: np.ndarray
+    cash_balance: np.ndarray
+    book_value: np.ndarray
+    # Cumulative profit has covered CAPEX
+    paid_back: np.ndarray
+
+
+def cycle_factors(cycle, seasonality=FLAT_SEASONALITY, price_inflation=0.0, cost_inflation=0.0,
+                  cycles=CYCLES_PER_YEAR):
+    """Revenue and cost multipliers for zero-based cycle indices ``cycle``.
+
+    ``cycles`` is the number of cycles per year. Inflation rates are annual
+    and compound once per cycle.
+    """
+    cycle = np.asarray(cycle)
+    years_elapsed = cycle / cycles
+    season = np.asarray(seasonality, dtype=np.float64)[cycle % len(seasonality)]
+    revenue_factor = season * (1 + price_inflation) ** years_elapsed
+    cost_factor = (1 + cost_inflation) ** years_elapsed
+    return revenue_factor, cost_factor
+
+
+def _projection_inputs(params, seasonality):
+    """CAPEX, OPEX and revenue per cycle of every scenario, and the shared cycles per year."""
+    p = as_batch(params)
+    cycle_months = np.unique(p.cycle_months)
+    if cycle_months.size != 1:
+        raise ValueError(f"all scenarios must share one cycle length, got {cycle_months.size} different lengths")
+    cycles = MONTHS_PER_YEAR / cycle_months.item()
+    if len(seasonality) not in (1, cycles):
+        raise ValueError(f"seasonality needs one factor or one per cycle ({cycles:g}), got {len(seasonality)}")
+    financials = _financials(p)
+    return financials[0], financials[1], financials[6], cycles
+
+
+def _cycle_weights(years, cycles):
+    """Share of each cycle inside a ``years`` horizon: ones, then the part-cycle it ends in.
+
+    Like ``risk.sample_adjusted_profit``, a horizon that ends part-way
+    through a cycle counts that cycle's share of it, so the projection
+    reaches exactly ``years`` and agrees with the annual figures.
+    """
+    # Rounded first so e.g. 3 years of 3.6-month cycles doesn't gain one to float error
+    weights = np.ones(math.ceil(round(years * cycles, 9)))
+    if weights.size:
+        weights[-1] = years * cycles - (weights.size - 1)
+    return weights
+
+
+def _accumulated_depreciation(capex, elapsed_cycles, depreciation_cycles):
+    # Straight line, never beyond CAPEX, however the last cycle falls
+    return capex * np.minimum(elapsed_cycles / depreciation_cycles, 1.0)
+
+
+def simulate_cycles(params, years=5, seasonality=FLAT_SEASONALITY, price_inflation=0.0,
+                    cost_inflation=0.0, depreciation_years=10, starting_cash=0.0):
+    """Project every scenario in ``params`` cycle by cycle for ``years`` years.
+
+    CAPEX is paid up front out of ``starting_cash`` and depreciated straight
+    line over ``depreciation_years``. A horizon that ends part-way through a
+    cycle ends with that share of it.
+    """
+    if not 1 <= years <= MAX_YEARS:
+        raise ValueError(f"years must be between 1 and {MAX_YEARS}, got {years}")
+    capex, opex_per_cycle, revenue_per_cycle, cycles = _projection_inputs(params, seasonality)
+    capex = capex[..., None]
+    opex_per_cycle = opex_per_cycle[..., None]
+    revenue_per_cycle = revenue_per_cycle[..., None]
+
+    weights = _cycle_weights(years, cycles)
+    cycle = np.arange(weights.size)
+    elapsed = cycle + weights
+    revenue_factor, cost_factor = cycle_factors(cycle, seasonality, price_inflation, cost_inflation, cycles)
+
+    revenue = revenue_per_cycle * (revenue_factor * weights)
+    opex = opex_per_cycle * (cost_factor * weights)
+    profit = revenue - opex
+    accumulated = _accumulated_depreciation(capex, elapsed, depreciation_years * cycles)
+    depreciation = np.diff(accumulated, axis=-1, prepend=0.0)
+    cumulative_profit = np.cumsum(profit, axis=-1)
+
+    return CycleSeries(
+        cycle=cycle + 1,
+        year=elapsed / cycles,
+        revenue=revenue,
+        opex=opex,
+        profit=profit,
+        depreciation=depreciation,
+        net_income=profit - depreciation,
+        cumulative_profit=cumulative_profit,
+        cash_balance=starting_cash - capex + cumulative_profit,
+        book_value=capex - accumulated,
+    )
+
+
+def iter_cycles(params, years=None, seasonality=FLAT_SEASONALITY, price_inflation=0.0,
+                cost_inflation=0.0, depreciation_years=10, starting_cash=0.0):
+    """Lazily yield a ``CycleStep`` per cycle, with the figures of ``simulate_cycles`` (to rounding).
+
+    Only one cycle of arrays is built at a time, so the horizon is not capped
+    at ``MAX_YEARS``; with ``years=None`` the iterator never ends and the
+    consumer decides when to stop (e.g. once every scenario has paid back).
+    """
+    capex, opex_per_cycle, revenue_per_cycle, cycles = _projection_inputs(params, seasonality)
+    depreciation_cycles = depreciation_years * cycles
+    weights = itertools.repeat(1.0) if years is None else _cycle_weights(years, cycles)
+    cumulative_profit = np.zeros_like(capex)
+    cumulative_depreciation = np.zeros_like(capex)
+    for cycle, weight in enumerate(weights):
+        weight = float(weight)
+        elapsed = cycle + weight
+        revenue_factor, cost_factor = cycle_factors(cycle, seasonality, price_inflation, cost_inflation, cycles)
+        revenue = revenue_per_cycle * (revenue_factor * weight)
+        opex = opex_per_cycle * (cost_factor * weight)
+        profit = revenue - opex
+        accumulated = _accumulated_depreciation(capex, elapsed, depreciation_cycles)
+        depreciation = accumulated - cumulative_depreciation
+        # New arrays every cycle, so steps a consumer keeps are never overwritten
+        cumulative_profit = cumulative_profit + profit
+        cumulative_depreciation = accumulated
+        yield CycleStep(
+            cycle=cycle + 1,
+            year=elapsed / cycles,
+            revenue=revenue,
+            opex=opex,
+            profit=profit,
+            depreciation=depreciation,
+            net_income=profit - depreciation,
+            cumulative_profit=cumulative_profit,
+            cash_balance=starting_cash - capex + cumulative_profit,
+            book_value=capex - cumulative_depreciation,
+            paid_back=cumulative_profit >= capex,
+        )
+
+
+def payback_years(params, max_years=100, **projection):
+    """Years until cumulative profit first covers CAPEX, per scenario; NaN if not within ``max_years``.
+
+    Streams ``iter_cycles`` (``projection`` takes its keyword arguments) and
+    stops as soon as every scenario has paid back.
+    """
+    years = np.full(as_batch(params).num_trays.shape, np.nan)
+    for step in iter_cycles(params, max_years, **projection):
+        years[step.paid_back & np.isnan(years)] = step.year
+        if not np.isnan(years).any():
+            break
+    return years
@@ -0,0 +1,28 @@
+"""Wall-clock timing of named sections of a single run."""
+
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class SectionTimer:
+    """Accumulates ``time.perf_counter`` durations per section name, in first-seen order."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings = {}
+
+    @contextmanager
+    def section(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+def section(timer, name):
+    """``timer.section(name)``, or a no-op when ``timer`` is None."""
+    return nullcontext() if timer is None else timer.section(name)
@@ -1,6 +1,226 @@
+import sys
+import threading
+
+if __name__ == "__main__" and "streamlit" not in sys.modules:
+    # Run as `python -m seedling_simulator ...` rather than `streamlit run`
+    from seedling_model.cli import main
+    sys.exit(main())
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+import numpy as np
+
+from seedling_model import (
+    DEFAULT_PRODUCTS,
+    MAX_YEARS,
+    MONTHS_PER_YEAR,
+    TRAY_FORMATS,
+    Params,
+    Product,
+    ResultCache,
+    RiskModel,
+    cached_monte_carlo,
+    category_totals,
+    cycles_per_year,
+    min_avg_price_veg,
+    min_num_trays,
+    min_success_rate,
+    optimize_mix,
+    simulate,
+    simulate_catalogue,
+    simulate_cycles,
+    stack_products,
+    tornado,
+)
+from seedling_model.assets import IMAGES, load_image
+from seedling_model.scenarios import SCENARIOS_PATH, ScenarioStore
+from seedling_model.timing import SectionTimer, section
+
+# Fixed seed so the risk figures don't jitter between reruns
+RISK_SEED = 2024
+RISK_TRIALS = 100_000
+
+PARAM_LABELS = {
+    'greenhouse_cost': "Greenhouse/Tunnel Cost",
+    'irrigation_cost': "Irrigation System Cost",
+    'tools_cost': "Tools & Equipment Cost",
+    'labor_cost_per_month': "Monthly Labor Cost",
+    'seed_cost_per_cycle': "Seed Cost per Cycle",
+    'medium_cost_per_cycle': "Growing Medium Cost per Cycle",
+    'num_trays': "Number of Seedling Trays",
+    'success_rate': "Seedling Success Rate",
+    'avg_price_veg': "Avg. Vegetable Seedling Price",
+    'avg_price_tree': "Avg. Tree Seedling Price",
+    'veg_percentage': "Percentage of Veggie Seedlings",
+    'cells_per_tray': "Cells per Tray",
+    'cycle_months': "Growing Cycle Length",
+}
+
+# Editable product table for the catalogue mode: column label -> Product field
+CATALOGUE_COLUMNS = {
+    "Product": 'name',
+    "Category": 'category',
+    "Cells per Tray": 'cells_per_tray',
+    "Germination (%)": 'germination_rate',
+    "Cycle (months)": 'cycle_months',
+    "Price ($)": 'price',
+    "Demand Cap (seedlings/year)": 'demand_cap',
+}
+CATALOGUE_TRAYS = 1000  # default trays per product
+
+# --- CACHED COMPUTATION ---
+# Results are shared across sessions and keyed on the full parameter tuple;
+# once CACHE_ENTRIES is reached the least recently used entries are evicted.
+CACHE_ENTRIES = 512
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner=False)
+def run_model(params):
+    return simulate(params)
+
+
+@st.cache_resource(show_spinner=False)
+def result_cache():
+    # Seeded runs persisted on disk, shared by every session and server restart
+    return ResultCache()
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner=False)
+def run_risk(params, risk_model):
+    # Only the summary is displayed, so don't keep the raw samples in either cache
+    return cached_monte_carlo(params, risk_model, trials=RISK_TRIALS, seed=RISK_SEED,
+                              cache=result_cache(), keep_samples=False)
+
+
+@st.cache_resource(show_spinner=False)
+def load_asset(name):
+    # Read, resize and compress each bundled image once per process
+    return load_image(name)
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner=False)
+def run_projection(params, years, price_inflation, cost_inflation):
+    series = simulate_cycles(params, years, price_inflation=price_inflation, cost_inflation=cost_inflation)
+    return series.year, series.cumulative_profit
+
+
+# Chart helpers import seedling_model.charts (Plotly) on first use rather
+# than at start-up. Arguments starting with an underscore are left out of
+# the cache key.
+@st.cache_resource(show_spinner=False)
+def chart_template(kind):
+    # One figure skeleton per process. Reruns patch its data in place and
+    # render it while holding the lock, since sessions run on separate threads.
+    from seedling_model import charts
+    build = charts.profit_template if kind == 'profit' else charts.revenue_mix_template
+    return build(), threading.Lock()
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner=False)
+def tornado_chart(params, metric, _timer=None):
+    from seedling_model.charts import tornado_figure
+    with section(_timer, "Model computation"):
+        result = tornado(params)
+    return tornado_figure(result, metric, PARAM_LABELS, _timer)
+
+
+def catalogue_from_table(table):
+    """Columnar catalogue and tray allocation from the edited product table."""
+    products, trays = [], []
+    for row in zip(*table.values()):
+        row = dict(zip(table, row))
+        values = {field: row[label] for label, field in CATALOGUE_COLUMNS.items()}
+        # Rows still being filled in are left out; a blank demand cap means no cap
+        if values['demand_cap'] is None:
+            values['demand_cap'] = np.inf
+        if any(value is None for value in values.values()) or row["Trays"] is None:
+            continue
+        values['germination_rate'] /= 100.0
+        products.append(Product(**values))
+        trays.append(row["Trays"])
+    return stack_products(products), np.asarray(trays, dtype=np.float64)
+
+
+def scenario_store():
+    # One store per session, seeded from the scenarios saved on disk
+    if "scenario_store" not in st.session_state:
+        try:
+            st.session_state.scenario_store = ScenarioStore.load() if SCENARIOS_PATH.exists() else ScenarioStore()
+        except (OSError, ValueError) as exc:
+            st.warning(f"Saved scenarios could not be loaded: {exc}")
+            st.session_state.scenario_store = ScenarioStore()
+    return st.session_state.scenario_store
+
+
+def save_scenarios(store):
+    try:
+        store.save()
+    except (OSError, ValueError) as exc:
+        st.warning(f"Scenarios are kept for this session only; saving them failed: {exc}")
+
+
+# --- RISK SIMULATION ---
+# A fragment reruns on its own when one of its widgets changes, so moving a
+# risk slider only recomputes the Monte Carlo summary and its metrics instead
+# of the whole dashboard. A fragment rerun keeps the arguments of the last
+# full run, and doesn't redraw the performance panel, so the section times
+# itself and shows its own timings.
+@st.fragment
+def risk_section(params, profit_per_year, show_performance):
+    timer = SectionTimer()
+    col1, col2 = st.columns(2)
+    with col1:
+        drought_probability = st.slider("Chance of Drought per Cycle (%)", 0, 50, 15, key="drought_probability") / 100.0
+        drought_sales_loss = st.slider("Average Sales Lost in a Drought (%)", 0, 50, 20, key="drought_sales_loss") / 100.0
+        pest_probability = st.slider("Chance of Pest Outbreak per Cycle (%)", 0, 50, 10, key="pest_probability") / 100.0
+        pest_yield_loss = st.slider("Average Yield Lost to Pests (%)", 0, 50, 15, key="pest_yield_loss") / 100.0
+        # Sample drought and pest events for every cycle of RISK_TRIALS simulated years
+        risk_model = RiskModel(drought_probability, drought_sales_loss, pest_probability, pest_yield_loss)
+        with timer.section("Model computation"):
+            risk = run_risk(params, risk_model)
+        st.warning(
+            "**Scenario:** Droughts can reduce farmer purchasing power, lowering sales, "
+            "and a severe pest attack can reduce the number of sellable seedlings."
+        )
+
+    with col2:
+        adjusted_profit = risk.mean
+        st.metric("Expected Adjusted Annual Profit", f"${adjusted_profit:,.0f}", f"{((adjusted_profit - profit_per_year) / profit_per_year) * 100 if profit_per_year else 0:.1f}% vs. No Risk")
+        col_p5, col_p50, col_p95 = st.columns(3)
+        col_p5.metric("Bad Year (P5)", f"${risk.p5:,.0f}")
+        col_p50.metric("Typical Year (P50)", f"${risk.p50:,.0f}")
+        col_p95.metric("Good Year (P95)", f"${risk.p95:,.0f}")
+        st.metric("Probability of an Annual Loss", f"{risk.probability_of_loss * 100:.1f}%")
+        st.info(f"**Mitigation Strategy:** Our model promotes drought-tolerant varieties and uses Integrated Pest Management (IPM) to minimize these risks.")
+    if show_performance:
+        st.caption(f"Risk section timings for its last rerun: model computation "
+                   f"{timer.timings.get('Model computation', 0.0) * 1000:.1f} ms, total {timer.elapsed() * 1000:.1f} ms.")
+
+
+# --- PERFORMANCE PANEL ---
+PERF_SECTIONS = [
+    "Sidebar widgets",
+    "Model computation",
+    "Chart data preparation",
+    "Plotly figure build",
+    "st.plotly_chart serialization",
+    "Image loading",
+]
+
+
+def show_performance_panel(timer, payload_sizes):
+    with st.expander("Performance", expanded=True):
+        st.caption("Timings for this rerun. Sections served from the cache show 0 ms; the risk simulation reports its own.")
+        timings = {name: timer.timings.get(name, 0.0) for name in PERF_SECTIONS}
+        timings.update(timer.timings)
+        st.table({
+            "Section": [*timings, "Total rerun"],
+            "Time (ms)": [f"{seconds * 1000:.1f}" for seconds in [*timings.values(), timer.elapsed()]],
+        })
+        if payload_sizes:
+            st.caption("Plotly JSON payload per chart: " + ", ".join(
+                f"{name} {size / 1024:.1f} KB" for name, size in payload_sizes.items()
+            ))
+
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
@@ -9,51 +229,240 @@ st.set_page_config(
     layout="wide",
 )
 
+timer = SectionTimer()
+payload_sizes = {}
+
 st.title("🌱 Commercial Seedling Nursery Simulation")
 st.markdown("An interactive model by Takunda for project in rural Zimbabwe.")
 
 # --- SIDEBAR FOR USER INPUTS ---
-st.sidebar.header("Simulation Parameters")
-
-# 1. Production and Costing Inputs
-st.sidebar.subheader("1. Investment & Costs")
-greenhouse_cost = st.sidebar.slider("Greenhouse/Tunnel Cost ($)", 1000, 10000, 3000)
-irrigation_cost = st.sidebar.slider("Irrigation System Cost ($)", 500, 5000, 2500)
-tools_cost = st.sidebar.slider("Tools & Equipment Cost ($)", 500, 5000, 2000)
-labor_cost_per_month = st.sidebar.slider("Total Monthly Labor Cost ($)", 200, 2000, 750) # Simplified for the slider
-seed_cost_per_cycle = st.sidebar.slider("Seed Cost per Cycle ($)", 200, 3000, 1000)
-medium_cost_per_cycle = st.sidebar.slider("Growing Medium Cost per Cycle ($)", 200, 2000, 800)
-
-# 2. Production Yield Inputs
-st.sidebar.subheader("2. Production Yield")
-num_trays = st.sidebar.number_input("Number of Seedling Trays", 5000, 20000, 10000)
-success_rate = st.sidebar.slider("Seedling Success Rate (%)", 50, 100, 85) / 100.0
-
-# 3. Market and Sales Inputs
-st.sidebar.subheader("3. Market & Sales")
-avg_price_veg = st.sidebar.slider("Avg. Vegetable Seedling Price ($)", 0.01, 0.20, 0.05, 0.01)
-avg_price_tree = st.sidebar.slider("Avg. Tree Seedling Price ($)", 0.05, 0.50, 0.15, 0.01)
-veg_percentage = st.sidebar.slider("Percentage of Veggie Seedlings (%)", 0, 100, 70) / 100.0
+with timer.section("Sidebar widgets"):
+    mode = st.sidebar.radio(
+        "Mode", ["Dashboard", "Product Catalogue", "Scenario Comparison", "Sensitivity Analysis"], horizontal=True,
+    )
+    batch_edit = st.sidebar.toggle(
+        "Batch edit",
+        help="Change several parameters, then press Apply to update the dashboard once.",
+    )
+    st.sidebar.header("Simulation Parameters")
+    # In batch edit mode the inputs live in a form, so dragging them doesn't rerun the app
+    inputs = st.sidebar.form("parameters") if batch_edit else st.sidebar
+
+    # 1. Production and Costing Inputs
+    inputs.subheader("1. Investment & Costs")
+    greenhouse_cost = inputs.slider("Greenhouse/Tunnel Cost ($)", 1000, 10000, 3000, key="greenhouse_cost")
+    irrigation_cost = inputs.slider("Irrigation System Cost ($)", 500, 5000, 2500, key="irrigation_cost")
+    tools_cost = inputs.slider("Tools & Equipment Cost ($)", 500, 5000, 2000, key="tools_cost")
+    labor_cost_per_month = inputs.slider("Total Monthly Labor Cost ($)", 200, 2000, 750, key="labor_cost_per_month") # Simplified for the slider
+    seed_cost_per_cycle = inputs.slider("Seed Cost per Cycle ($)", 200, 3000, 1000, key="seed_cost_per_cycle")
+    medium_cost_per_cycle = inputs.slider("Growing Medium Cost per Cycle ($)", 200, 2000, 800, key="medium_cost_per_cycle")
+
+    # 2. Production Yield Inputs
+    inputs.subheader("2. Production Yield")
+    num_trays = inputs.number_input("Number of Seedling Trays", 5000, 20000, 10000, key="num_trays")
+    success_rate = inputs.slider("Seedling Success Rate (%)", 50, 100, 85, key="success_rate") / 100.0
+    cells_per_tray = inputs.select_slider("Cells per Tray", TRAY_FORMATS, 200, key="cells_per_tray")
+    cycle_months = inputs.slider("Growing Cycle Length (months)", 1.0, 6.0, 3.0, 0.5, key="cycle_months")
+
+    # 3. Market and Sales Inputs
+    inputs.subheader("3. Market & Sales")
+    avg_price_veg = inputs.slider("Avg. Vegetable Seedling Price ($)", 0.01, 0.20, 0.05, 0.01, key="avg_price_veg")
+    avg_price_tree = inputs.slider("Avg. Tree Seedling Price ($)", 0.05, 0.50, 0.15, 0.01, key="avg_price_tree")
+    veg_percentage = inputs.slider("Percentage of Veggie Seedlings (%)", 0, 100, 70, key="veg_percentage") / 100.0
+    if batch_edit:
+        inputs.form_submit_button("Apply", type="primary")
+    show_performance = st.sidebar.checkbox("Show performance panel")
 
 # --- CORE SIMULATION LOGIC (Calculations) ---
+params = Params(
+    greenhouse_cost=greenhouse_cost,
+    irrigation_cost=irrigation_cost,
+    tools_cost=tools_cost,
+    labor_cost_per_month=labor_cost_per_month,
+    seed_cost_per_cycle=seed_cost_per_cycle,
+    medium_cost_per_cycle=medium_cost_per_cycle,
+    num_trays=num_trays,
+    success_rate=success_rate,
+    avg_price_veg=avg_price_veg,
+    avg_price_tree=avg_price_tree,
+    veg_percentage=veg_percentage,
+    cells_per_tray=cells_per_tray,
+    cycle_months=cycle_months,
+)
+with timer.section("Model computation"):
+    results = run_model(params)
+capex = results.capex
+opex_per_cycle = results.opex_per_cycle
+revenue_per_cycle = results.revenue_per_cycle
+profit_per_year = results.profit_per_year
+num_veg_seedlings = results.num_veg_seedlings
+num_tree_seedlings = results.num_tree_seedlings
+
+# --- SENSITIVITY ANALYSIS MODE ---
+if mode == "Sensitivity Analysis":
+    st.header("Sensitivity Analysis")
+    st.markdown("Each input is moved to the bottom and top of its slider range while all others stay at their current values.")
+    col1, col2 = st.columns(2)
+    fig_tornado_profit = tornado_chart(params, 'profit', _timer=timer)
+    fig_tornado_roi = tornado_chart(params, 'roi', _timer=timer)
+    with timer.section("st.plotly_chart serialization"):
+        col1.plotly_chart(fig_tornado_profit, width="stretch")
+        if fig_tornado_roi is None:
+            col2.info("No payback at current inputs: the nursery loses money, so there is no payback period to vary.")
+        else:
+            col2.plotly_chart(fig_tornado_roi, width="stretch")
+    if show_performance:
+        payload_sizes["Profit tornado"] = len(fig_tornado_profit.to_json())
+        if fig_tornado_roi is not None:
+            payload_sizes["ROI tornado"] = len(fig_tornado_roi.to_json())
+        show_performance_panel(timer, payload_sizes)
+    st.stop()
+
+# --- PRODUCT CATALOGUE MODE ---
+if mode == "Product Catalogue":
+    st.header("Product Catalogue")
+    st.markdown(
+        "Plan production product by product. Trays are bench positions, so short-cycle products are sown "
+        "more often per year; sales are capped at each product's yearly demand. CAPEX and running costs "
+        "come from the sidebar."
+    )
+    table = st.data_editor(
+        {
+            **{label: [getattr(product, field) for product in DEFAULT_PRODUCTS] for label, field in CATALOGUE_COLUMNS.items()},
+            "Germination (%)": [product.germination_rate * 100 for product in DEFAULT_PRODUCTS],
+            "Trays": [CATALOGUE_TRAYS] * len(DEFAULT_PRODUCTS),
+        },
+        key="catalogue",
+        num_rows="dynamic",
+        width="stretch",
+        column_config={
+            "Category": st.column_config.SelectboxColumn(options=["Vegetable", "Tree"], required=True),
+            "Germination (%)": st.column_config.NumberColumn(min_value=0, max_value=100),
+            "Cycle (months)": st.column_config.NumberColumn(min_value=0.25),
+            "Price ($)": st.column_config.NumberColumn(min_value=0, format="$%.2f"),
+            "Trays": st.column_config.NumberColumn(min_value=0, step=1),
+        },
+    )
+    catalogue, trays = catalogue_from_table(table)
+    with timer.section("Model computation"):
+        sales = simulate_catalogue(catalogue, trays)
+        opex_per_year = opex_per_cycle * cycles_per_year(params)
+        catalogue_profit = sales.total_revenue - opex_per_year
+        by_category = category_totals(catalogue, sales.revenue)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Trays on Benches", f"{trays.sum():,.0f}")
+    col2.metric("Revenue/Year", f"${sales.total_revenue:,.0f}")
+    col3.metric("OPEX/Year", f"${opex_per_year:,.0f}")
+    col4.metric("Profit/Year", f"${catalogue_profit:,.0f}")
 
-# 1. Costing Calculation
-capex = greenhouse_cost + irrigation_cost + tools_cost
-opex_per_cycle = (labor_cost_per_month * 3) + seed_cost_per_cycle + medium_cost_per_cycle
+    col1, col2 = st.columns([2, 1])
+    col1.subheader("Sales by Product")
+    col1.dataframe({
+        "Product": catalogue.name,
+        "Seedlings/Year": sales.seedlings.round(),
+        "Sold/Year": sales.sold.round(),
+        "Revenue/Year ($)": sales.revenue.round(2),
+    }, width="stretch", hide_index=True)
+    with col2:
+        from seedling_model.charts import patch_revenue_mix_figure
+        st.subheader("Revenue Mix per Year")
+        fig_pie, fig_lock = chart_template('revenue_mix')
+        with fig_lock:
+            patch_revenue_mix_figure(fig_pie, by_category.get("Vegetable", 0.0), by_category.get("Tree", 0.0), timer)
+            with timer.section("st.plotly_chart serialization"):
+                st.plotly_chart(fig_pie, width="stretch")
+
+    st.subheader("Optimal Tray Mix")
+    st.markdown(
+        "The allocation that earns the most per year from the sidebar's trays, labor and growing medium. "
+        "Each sowing of a tray uses the labor and medium that one tray gets per cycle in the sidebar model, "
+        "and no product is grown beyond its demand cap."
+    )
+    if not catalogue.name:
+        st.info("Add at least one complete product to the catalogue to find the optimal tray mix.")
+        if show_performance:
+            show_performance_panel(timer, payload_sizes)
+        st.stop()
+    whole_trays = st.toggle("Whole trays only", help="Solve as an integer program instead of allowing fractional trays.")
+    with timer.section("Model computation"):
+        # Per-sowing costs that exactly use the sidebar budgets when every tray is on the sidebar's cycle
+        labor_per_tray = labor_cost_per_month * cycle_months / num_trays
+        medium_per_tray = medium_cost_per_cycle / num_trays
+        mix = optimize_mix(
+            catalogue, num_trays, labor_per_tray, medium_per_tray,
+            labor_budget=labor_cost_per_month * MONTHS_PER_YEAR,
+            medium_budget=medium_cost_per_cycle * cycles_per_year(params),
+            integer=whole_trays,
+        )
+    if not mix.success:
+        st.error(f"No optimal mix found: {mix.message}")
+    else:
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Trays Used", f"{mix.trays.sum():,.0f}", f"of {num_trays:,.0f}", delta_color="off")
+        col2.metric("Optimal Revenue/Year", f"${mix.total_revenue:,.0f}", f"${mix.total_revenue - sales.total_revenue:,.0f} vs. table")
+        col3.metric("Labor Used/Year", f"${mix.labor_cost.sum():,.0f}", f"of ${labor_cost_per_month * MONTHS_PER_YEAR:,.0f}", delta_color="off")
+        col4.metric("Medium Used/Year", f"${mix.medium_cost.sum():,.0f}", f"of ${medium_cost_per_cycle * cycles_per_year(params):,.0f}", delta_color="off")
+        st.dataframe({
+            "Product": catalogue.name,
+            "Trays in Table": trays,
+            "Optimal Trays": mix.trays.round(1),
+            "Sold/Year": mix.sold.round(),
+            "Revenue/Year ($)": mix.revenue.round(2),
+        }, width="stretch", hide_index=True)
+    if show_performance:
+        show_performance_panel(timer, payload_sizes)
+    st.stop()
 
-# 2. Yield Calculation
-total_potential_seedlings = num_trays * 200 # Assuming 200 cells per tray
-projected_yield = total_potential_seedlings * success_rate
+# --- SCENARIO COMPARISON MODE ---
+if mode == "Scenario Comparison":
+    st.header("Scenario Comparison")
+    st.markdown(
+        "Save the sidebar inputs as named scenarios and compare them side by side. Scenarios are written to "
+        f"`{SCENARIOS_PATH.name}`, so they are still there after a restart."
+    )
+    store = scenario_store()
+    with st.expander("Manage Scenarios", expanded=not store):
+        col_name, col_save = st.columns([3, 1], vertical_alignment="bottom")
+        scenario_name = col_name.text_input("Scenario name", f"Scenario {len(store) + 1}").strip()
+        if col_save.button("Save Sidebar Inputs", type="primary", width="stretch", disabled=not scenario_name):
+            store.put(scenario_name, params)
+            save_scenarios(store)
+        if store:
+            col_name, col_delete = st.columns([3, 1], vertical_alignment="bottom")
+            to_delete = col_name.selectbox("Saved scenario", list(store))
+            if col_delete.button("Delete", width="stretch"):
+                store.remove(to_delete)
+                save_scenarios(store)
+                st.rerun()
 
-# 3. Revenue Calculation
-num_veg_seedlings = projected_yield * veg_percentage
-num_tree_seedlings = projected_yield * (1 - veg_percentage)
-revenue_per_cycle = (num_veg_seedlings * avg_price_veg) + (num_tree_seedlings * avg_price_tree)
+    if not store:
+        st.info("No scenarios saved yet.")
+    else:
+        selected = st.multiselect("Scenarios to compare", list(store), default=list(store))
+        years = st.slider("Projection Horizon (years)", 1, MAX_YEARS, 5, key="comparison_years")
+        with timer.section("Model computation"):
+            comparison = store.compare(selected, years)
+        results = comparison.results
+        st.dataframe({
+            "Scenario": comparison.names,
+            "CAPEX ($)": results.capex.round(),
+            "OPEX per Cycle ($)": results.opex_per_cycle.round(),
+            "Revenue per Cycle ($)": results.revenue_per_cycle.round(),
+            "Profit/Year ($)": results.profit_per_year.round(),
+            "ROI (years)": np.where(np.isfinite(results.roi_years), results.roi_years.round(3), None),
+        }, width="stretch", hide_index=True)
 
-# 4. Profitability Calculation
-profit_per_cycle = revenue_per_cycle - opex_per_cycle
-profit_per_year = profit_per_cycle * 4 # Assuming 4 cycles per year
-roi_years = capex / profit_per_year if profit_per_year > 0 else float('inf')
+        from seedling_model.charts import scenario_comparison_figure
+        fig_comparison = scenario_comparison_figure(comparison.names, comparison.year, comparison.cumulative_profit, timer)
+        with timer.section("st.plotly_chart serialization"):
+            st.plotly_chart(fig_comparison, width="stretch")
+        st.caption(f"{store.last_evaluated} of {len(selected)} scenarios evaluated on this rerun; unchanged ones are reused.")
+        if show_performance:
+            payload_sizes["Scenario comparison"] = len(fig_comparison.to_json())
+    if show_performance:
+        show_performance_panel(timer, payload_sizes)
+    st.stop()
 
 # --- MAIN DASHBOARD DISPLAY ---
 
@@ -61,88 +470,73 @@ roi_years = capex / profit_per_year if profit_per_year > 0 else float('inf')
 st.header("Financial Dashboard")
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("Initial CAPEX", f"${capex:,.0f}", help="One-time setup costs")
-col2.metric("OPEX per Cycle", f"${opex_per_cycle:,.0f}", help="Recurring costs every 3 months")
+col2.metric("OPEX per Cycle", f"${opex_per_cycle:,.0f}", help=f"Recurring costs every {cycle_months:g} months")
 col3.metric("Projected Revenue/Cycle", f"${revenue_per_cycle:,.0f}")
 col4.metric("Projected Profit/Year", f"${profit_per_year:,.0f}", delta_color="inverse")
 
+with st.expander("Break-even Targets"):
+    target_roi_years = st.slider("Target Payback Period (years)", 0.25, 10.0, 1.0, 0.25)
+    col1, col2, col3 = st.columns(3)
+    with timer.section("Model computation"):
+        required_rate = min_success_rate(params, target_roi_years)
+        required_price = min_avg_price_veg(params, target_roi_years)
+        required_trays = min_num_trays(params, target_roi_years)
+    col1.metric("Minimum Success Rate", f"{required_rate * 100:.1f}%" if np.isfinite(required_rate) else "Not reachable")
+    col2.metric("Minimum Vegetable Seedling Price", f"${required_price:,.3f}" if np.isfinite(required_price) else "Not reachable")
+    col3.metric("Minimum Number of Trays", f"{required_trays:,.0f}" if np.isfinite(required_trays) else "Not reachable")
+
 
 # Row 2: Charts and Visuals
+# Plotly is first needed here, so the chart module is imported here rather than at start-up
+from seedling_model.charts import patch_profit_figure, patch_revenue_mix_figure
+
 st.header("Visual Projections")
 col1, col2 = st.columns([2, 1])
 
 with col1:
     # Profitability Chart
     st.subheader("Profitability Over Time")
-    profit_data = {
-        'Year': [1, 2, 3, 4, 5],
-        'Cumulative Profit ($)': [profit_per_year * i for i in range(1, 6)]
-    }
-    profit_df = pd.DataFrame(profit_data)
-    fig_profit = px.line(
-        profit_df,
-        x='Year',
-        y='Cumulative Profit ($)',
-        title="5-Year Cumulative Profit Projection",
-        markers=True
-    )
-    # Add a line for the initial investment
-    fig_profit.add_hline(y=capex, line_dash="dot", annotation_text="Initial Investment (CAPEX)", annotation_position="bottom right")
-    st.plotly_chart(fig_profit, use_container_width=True)
+    col_years, col_price, col_cost = st.columns(3)
+    projection_years = col_years.slider("Projection Horizon (years)", 1, MAX_YEARS, 5)
+    price_inflation = col_price.slider("Annual Price Inflation (%)", 0, 20, 0) / 100.0
+    cost_inflation = col_cost.slider("Annual Cost Inflation (%)", 0, 20, 0) / 100.0
+    with timer.section("Model computation"):
+        year, cumulative_profit = run_projection(params, projection_years, price_inflation, cost_inflation)
+    fig_profit, fig_lock = chart_template('profit')
+    with fig_lock:
+        patch_profit_figure(fig_profit, year, cumulative_profit, capex, projection_years, timer)
+        with timer.section("st.plotly_chart serialization"):
+            st.plotly_chart(fig_profit, width="stretch")
+        if show_performance:
+            payload_sizes["Profitability"] = len(fig_profit.to_json())
 
 
 with col2:
     # Revenue Breakdown Chart
     st.subheader("Revenue Mix per Cycle")
-    revenue_mix_data = {
-        'Seedling Type': ['Vegetable', 'Tree'],
-        'Revenue ($)': [num_veg_seedlings * avg_price_veg, num_tree_seedlings * avg_price_tree]
-    }
-    revenue_df = pd.DataFrame(revenue_mix_data)
-    fig_pie = px.pie(
-        revenue_df,
-        names='Seedling Type',
-        values='Revenue ($)',
-        hole=0.4,
-        color_discrete_map={'Vegetable':'#2ca02c', 'Tree':'#8c564b'}
-    )
-    st.plotly_chart(fig_pie, use_container_width=True)
+    fig_pie, fig_lock = chart_template('revenue_mix')
+    with fig_lock:
+        patch_revenue_mix_figure(fig_pie, num_veg_seedlings * avg_price_veg, num_tree_seedlings * avg_price_tree, timer)
+        with timer.section("st.plotly_chart serialization"):
+            st.plotly_chart(fig_pie, width="stretch")
+        if show_performance:
+            payload_sizes["Revenue mix"] = len(fig_pie.to_json())
 
 
 # Row 3: Risks and Sustainability
 st.header("5. Risks & Sustainability")
 st.subheader("Interactive Risk Simulation")
 
-col1, col2 = st.columns(2)
-with col1:
-    risk_factor = st.select_slider(
-        "Simulate a risk event:",
-        options=['No Risk', 'Drought (-20% sales)', 'Pest Outbreak (-15% yield)'],
-        value='No Risk'
-    )
-    # Apply risk to calculations
-    adjusted_revenue = revenue_per_cycle
-    risk_info = ""
-    if 'Drought' in risk_factor:
-        adjusted_revenue *= 0.80
-        risk_info = "Droughts can reduce farmer purchasing power, lowering sales."
-    if 'Pest' in risk_factor:
-        adjusted_yield = projected_yield * 0.85
-        adjusted_revenue = (adjusted_yield * veg_percentage * avg_price_veg) + \
-                           (adjusted_yield * (1 - veg_percentage) * avg_price_tree)
-        risk_info = "A severe pest attack can reduce the number of sellable seedlings."
-
-    adjusted_profit = (adjusted_revenue - opex_per_cycle) * 4
-    st.warning(f"**Scenario:** {risk_info}")
-
-
-with col2:
-    st.metric("Adjusted Annual Profit", f"${adjusted_profit:,.0f}", f"{((adjusted_profit - profit_per_year) / profit_per_year) * 100 if profit_per_year else 0:.1f}% vs. No Risk")
-    st.info(f"**Mitigation Strategy:** Our model promotes drought-tolerant varieties and uses Integrated Pest Management (IPM) to minimize these risks.")
+risk_section(params, profit_per_year, show_performance)
 
 # Add some visual appeal
 st.header("Project Vision")
-st.image("http://googleusercontent.com/image_collection/image_retrieval/12460295809072866260_0", caption="A vision for our commercial nursery in rural Zimbabwe.", use_column_width=True)
+with timer.section("Image loading"):
+    st.image(load_asset('vision'), caption=IMAGES['vision'].caption, width="stretch")
+
+    col1, col2 = st.columns(2)
+    col1.image(load_asset('vegetable_seedlings'), caption=IMAGES['vegetable_seedlings'].caption, width="stretch")
+    col2.image(load_asset('tree_seedlings'), caption=IMAGES['tree_seedlings'].caption, width="stretch")
 
-col1, col2 = st.columns(2)
-col1.image("http://googleusercontent.com/image_collection/image_retrieval/8150812869663407436_0", caption="High-quality vegetable seedlings ready for local farmers.", use_column_width=True)
-col2.image("http://googleusercontent.com/image_collection/image_retrieval/5002659753976204598_0", caption="Tree seedlings to support afforestation and community orchards.", use_column_width=True)
\ No newline at end of file
+if show_performance:
+    show_performance_panel(timer, payload_sizes)
\ No newline at end of file